@@ -0,0 +1,395 @@
+# Detection script for VMware Horizon `"FIPS`" Client 1.0.0
+# Generated by NAPT (Not a Package Tool)
+# Checks registry for installed software matching the expected name and version.
+# Supports exact version match or minimum version (installed >= expected).
+# Exits with code 0 if detected, code 1 if not detected.
+
+param(
+    [string]$AppName = "VMware Horizon `"FIPS`" Client",
+    [string]$ExpectedVersion = "1.0.0",
+    [bool]$ExactMatch = $False,
+    [bool]$IsMSIInstaller = $False,
+    [string]$ExpectedArchitecture = "any"
+)
+
+# CMTrace log format function
+function Write-CMTraceLog {
+    param(
+        [string]$Message,
+        [string]$Component = $script:ComponentName,
+        [string]$Type = "INFO"  # "INFO", "WARNING", "ERROR", "DEBUG"
+    )
+
+    $LogFile = $script:LogFilePath
+
+    if (-not $LogFile) {
+        return
+    }
+
+    # Convert string log level to CMTrace numeric type
+    # 1=Info, 2=Warning, 3=Error, 4=Debug
+    $TypeNumber = switch ($Type.ToUpper()) {
+        "INFO" { 1 }
+        "WARNING" { 2 }
+        "ERROR" { 3 }
+        "DEBUG" { 4 }
+        default { 1 }  # Default to INFO if unknown
+    }
+
+    # Format time: HH:mm:ss.fff+bias. ConfigMgr bias is UTC minus local time
+    # in minutes with an explicit sign (e.g., +480 for UTC-8, -120 for UTC+2).
+    $Now = [DateTimeOffset](Get-Date)
+    $TimeFormatted = $Now.ToString("HH:mm:ss.fff")
+    $BiasMinutes = -[int]$Now.Offset.TotalMinutes
+    $TimeWithOffset = "$TimeFormatted$($BiasMinutes.ToString('+000;-000'))"
+
+    # Format date: M-d-yyyy (single digit month/day when appropriate)
+    $DateFormatted = $Now.ToString("M-d-yyyy")
+
+    # Get context (user identity name) and script file path
+    $ContextName = if ($script:CurrentIdentity) { $script:CurrentIdentity.Name } else { "UNKNOWN" }
+    $ScriptFile = if ($MyInvocation.ScriptName) { $MyInvocation.ScriptName } else { "detection.ps1" }
+
+    $Line = "<![LOG[$Message]LOG]!><time=""$TimeWithOffset"" date=""$DateFormatted"" component=""$Component"" context=""$ContextName"" type=""$TypeNumber"" thread=""$PID"" file=""$ScriptFile"">"
+
+    try {
+        Add-Content -Path $LogFile -Value $Line -Encoding UTF8 -ErrorAction SilentlyContinue
+    } catch {
+        # Silently fail if we can't write to log
+    }
+}
+
+# Parse a version string into numeric parts. Each '.'- or '-'-separated
+# segment contributes its leading digits; segments without leading digits
+# count as 0, so prerelease identifiers are not ranked ("1.2.3-beta"
+# parses the same as "1.2.3.0").
+function ConvertTo-VersionParts {
+    param(
+        [string]$Version
+    )
+
+    $Parts = @()
+    $HasNonNumeric = $false
+
+    foreach ($Segment in ($Version -split '[.\-]')) {
+        if ($Segment -match '^(\d+)') {
+            $Parts += [int64]$Matches[1]
+            if ($Segment -ne $Matches[1]) { $HasNonNumeric = $true }
+        } else {
+            $Parts += [int64]0
+            $HasNonNumeric = $true
+        }
+    }
+
+    if ($HasNonNumeric) {
+        Write-CMTraceLog -Message "[Detection] Version '$Version' contains non-numeric segments, comparing as '$($Parts -join '.')'" -Type "WARNING"
+    }
+
+    return ,$Parts
+}
+
+# Compare two version strings numerically. Returns -1 if Left < Right,
+# 0 if equal, 1 if Left > Right. Missing trailing parts count as 0.
+function Compare-VersionString {
+    param(
+        [string]$LeftVersion,
+        [string]$RightVersion
+    )
+
+    $LeftParts = ConvertTo-VersionParts -Version $LeftVersion
+    $RightParts = ConvertTo-VersionParts -Version $RightVersion
+
+    $MaxLength = [Math]::Max($LeftParts.Count, $RightParts.Count)
+
+    for ($i = 0; $i -lt $MaxLength; $i++) {
+        $LeftPart = if ($i -lt $LeftParts.Count) { $LeftParts[$i] } else { [int64]0 }
+        $RightPart = if ($i -lt $RightParts.Count) { $RightParts[$i] } else { [int64]0 }
+
+        if ($LeftPart -gt $RightPart) { return 1 }
+        if ($LeftPart -lt $RightPart) { return -1 }
+    }
+
+    return 0
+}
+
+# Determine log file location
+function Initialize-LogFile {
+    $script:CurrentIdentity = [System.Security.Principal.WindowsIdentity]::GetCurrent()
+    $IsSystemContext = $script:CurrentIdentity.Name -eq "NT AUTHORITY\SYSTEM"
+
+    if ($IsSystemContext) {
+        # System context - try Intune log folder first
+        $PrimaryLogDir = "C:\ProgramData\Microsoft\IntuneManagementExtension\Logs"
+        $PrimaryLogFile = Join-Path $PrimaryLogDir "NAPTDetections.log"
+        $FallbackLogDir = "C:\ProgramData\NAPT"
+        $FallbackLogFile = Join-Path $FallbackLogDir "NAPTDetections.log"
+    } else {
+        # User context
+        $PrimaryLogDir = "C:\ProgramData\Microsoft\IntuneManagementExtension\Logs"
+        $PrimaryLogFile = Join-Path $PrimaryLogDir "NAPTDetectionsUser.log"
+        $FallbackLogDir = $env:LOCALAPPDATA
+        $FallbackLogFile = Join-Path $FallbackLogDir "NAPT\NAPTDetectionsUser.log"
+    }
+
+    # Try primary location first
+    try {
+        # Ensure parent directory exists (fails with -ErrorAction Stop if no perms)
+        $PrimaryLogParent = Split-Path -Path $PrimaryLogFile -Parent
+        if (-not (Test-Path -Path $PrimaryLogParent)) {
+            New-Item -Path $PrimaryLogParent -ItemType Directory -Force -ErrorAction Stop | Out-Null
+        }
+
+        # Handle log rotation if needed
+        if (Test-Path -Path $PrimaryLogFile) {
+            $LogSize = (Get-Item $PrimaryLogFile).Length
+            $MaxSize = 3 * 1024 * 1024
+            if ($LogSize -ge $MaxSize) {
+                $OldLogFile = "$PrimaryLogFile.old"
+                if (Test-Path $OldLogFile) { Remove-Item $OldLogFile -Force -ErrorAction Stop }
+                Move-Item -Path $PrimaryLogFile -Destination $OldLogFile -Force -ErrorAction Stop
+            }
+        }
+
+        # Verify write access (appends empty string - fails if no write permission)
+        [System.IO.File]::AppendAllText($PrimaryLogFile, "")
+        $script:LogFilePath = $PrimaryLogFile
+        return
+    } catch {
+        # Fall through to fallback (directory creation, rotation, or write failed)
+    }
+
+    # Fallback location
+    try {
+        $FallbackLogParent = Split-Path -Path $FallbackLogFile -Parent
+        if (-not (Test-Path -Path $FallbackLogParent)) {
+            New-Item -Path $FallbackLogParent -ItemType Directory -Force -ErrorAction Stop | Out-Null
+        }
+
+        if (Test-Path -Path $FallbackLogFile) {
+            $LogSize = (Get-Item $FallbackLogFile).Length
+            $MaxSize = 3 * 1024 * 1024
+            if ($LogSize -ge $MaxSize) {
+                $OldLogFile = "$FallbackLogFile.old"
+                if (Test-Path $OldLogFile) { Remove-Item $OldLogFile -Force -ErrorAction Stop }
+                Move-Item -Path $FallbackLogFile -Destination $OldLogFile -Force -ErrorAction Stop
+            }
+        }
+
+        [System.IO.File]::AppendAllText($FallbackLogFile, "")
+        $script:LogFilePath = $FallbackLogFile
+    } catch {
+        # All log locations failed - log warning to stderr and continue
+        Write-Warning "NAPT [Detection] Failed to initialize logging (primary and fallback locations unavailable). Script will continue but no log file will be created."
+        $script:LogFilePath = $null
+    }
+}
+
+
+# Main detection logic
+Initialize-LogFile
+
+# Build component identifier from app name and version (sanitized for valid identifier)
+$SanitizedAppName = $AppName -replace '[^a-zA-Z0-9]', '-' -replace '-+', '-' -replace '^-|-$', ''
+$script:ComponentName = "$SanitizedAppName-$ExpectedVersion-Detection"
+
+Write-CMTraceLog -Message "[Initialization] Detection script running as user: $($script:CurrentIdentity.Name)" -Type "INFO"
+Write-CMTraceLog -Message "[Initialization] Starting detection check for: $AppName (Expected: $ExpectedVersion, Mode: $(if ($ExactMatch) { 'Exact Match' } else { 'Minimum Version' }), Installer Type: $(if ($IsMSIInstaller) { 'MSI' } else { 'Non-MSI' }), Architecture: $ExpectedArchitecture)" -Type "INFO"
+
+# Detect OS architecture
+$Is64BitOS = [Environment]::Is64BitOperatingSystem
+
+Write-CMTraceLog -Message "[Initialization] OS Architecture: $(if ($Is64BitOS) { '64-bit' } else { '32-bit' })" -Type "INFO"
+Write-CMTraceLog -Message "[Initialization] PowerShell Process: $(if ([Environment]::Is64BitProcess) { '64-bit' } else { '32-bit' })" -Type "INFO"
+
+# Build list of registry keys to check based on expected architecture
+# Uses OpenBaseKey with explicit RegistryView for deterministic behavior
+$AllKeys = @()
+
+# Determine which registry views to check based on architecture
+$CheckViews = @()
+
+# Check if registry entry is MSI-based installation
+function Test-IsMSIInstallation {
+    param(
+        [Microsoft.Win32.RegistryKey]$RegKey
+    )
+
+    # Check WindowsInstaller DWORD value - set automatically by Windows Installer
+    # for all MSI installations. This is the authoritative indicator.
+    try {
+        $WindowsInstaller = $RegKey.GetValue("WindowsInstaller")
+        return ($WindowsInstaller -eq 1)
+    } catch {
+        return $false
+    }
+}
+
+# Get registry keys using explicit RegistryView for deterministic behavior
+# This works regardless of PowerShell process bitness
+function Get-UninstallKeys {
+    param(
+        [Microsoft.Win32.RegistryHive]$Hive,
+        [Microsoft.Win32.RegistryView]$View,
+        [string]$ViewName
+    )
+
+    $Results = @()
+    $UninstallPath = "SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+
+    try {
+        $BaseKey = [Microsoft.Win32.RegistryKey]::OpenBaseKey($Hive, $View)
+        $UninstallKey = $BaseKey.OpenSubKey($UninstallPath)
+
+        if ($UninstallKey) {
+            foreach ($SubKeyName in $UninstallKey.GetSubKeyNames()) {
+                try {
+                    $SubKey = $UninstallKey.OpenSubKey($SubKeyName)
+                    if ($SubKey) {
+                        $Results += @{
+                            Key = $SubKey
+                            Hive = $Hive
+                            View = $ViewName
+                            Path = "$($( if ($Hive -eq [Microsoft.Win32.RegistryHive]::LocalMachine) { 'HKLM' } else { 'HKCU' } )):\$UninstallPath\$SubKeyName"
+                        }
+                    }
+                } catch {
+                    # Skip keys we can't open
+                }
+            }
+        }
+
+        # Note: Don't close BaseKey/UninstallKey here as SubKeys are still in use
+    } catch {
+        Write-CMTraceLog -Message "[Detection] Error opening registry: $Hive $ViewName - $($_.Exception.Message)" -Type "WARNING"
+    }
+
+    return $Results
+}
+
+# Determine which registry views to check based on architecture
+switch ($ExpectedArchitecture.ToLower()) {
+    "x64" {
+        if (-not $Is64BitOS) {
+            Write-CMTraceLog -Message "[Detection] Expected x64 architecture but running on 32-bit OS - app cannot be installed" -Type "WARNING"
+        } else {
+            $CheckViews += @{ View = [Microsoft.Win32.RegistryView]::Registry64; Name = "64-bit" }
+        }
+    }
+    "arm64" {
+        # ARM64 uses 64-bit registry view
+        if (-not $Is64BitOS) {
+            Write-CMTraceLog -Message "[Detection] Expected arm64 architecture but running on 32-bit OS - app cannot be installed" -Type "WARNING"
+        } else {
+            $CheckViews += @{ View = [Microsoft.Win32.RegistryView]::Registry64; Name = "64-bit (ARM64)" }
+        }
+    }
+    "x86" {
+        $CheckViews += @{ View = [Microsoft.Win32.RegistryView]::Registry32; Name = "32-bit" }
+    }
+    "any" {
+        # Check both views (permissive mode)
+        if ($Is64BitOS) {
+            $CheckViews += @{ View = [Microsoft.Win32.RegistryView]::Registry64; Name = "64-bit" }
+        }
+        $CheckViews += @{ View = [Microsoft.Win32.RegistryView]::Registry32; Name = "32-bit" }
+    }
+    default {
+        Write-CMTraceLog -Message "[Detection] Unknown architecture '$ExpectedArchitecture', defaulting to 'any'" -Type "WARNING"
+        if ($Is64BitOS) {
+            $CheckViews += @{ View = [Microsoft.Win32.RegistryView]::Registry64; Name = "64-bit" }
+        }
+        $CheckViews += @{ View = [Microsoft.Win32.RegistryView]::Registry32; Name = "32-bit" }
+    }
+}
+
+# Build literal registry paths for logging (matches actual paths opened by OpenBaseKey per view)
+$RegPathDescriptions = @()
+foreach ($ViewInfo in $CheckViews) {
+    if ($ViewInfo.Name -like '64-bit*') {
+        $RegPathDescriptions += "HKLM:\SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+        $RegPathDescriptions += "HKCU:\SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+    } else {
+        if ($Is64BitOS) {
+            $RegPathDescriptions += "HKLM:\SOFTWARE\WOW6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
+            $RegPathDescriptions += "HKCU:\SOFTWARE\Wow6432Node\Microsoft\Windows\CurrentVersion\Uninstall"
+        } else {
+            $RegPathDescriptions += "HKLM:\SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+            $RegPathDescriptions += "HKCU:\SOFTWARE\Microsoft\Windows\CurrentVersion\Uninstall"
+        }
+    }
+}
+Write-CMTraceLog -Message "[Initialization] Registry paths to check: $($RegPathDescriptions -join ', ')" -Type "INFO"
+
+
+# Collect all registry keys from selected views
+foreach ($ViewInfo in $CheckViews) {
+    # HKLM (machine-level installations)
+    $AllKeys += Get-UninstallKeys -Hive ([Microsoft.Win32.RegistryHive]::LocalMachine) -View $ViewInfo.View -ViewName $ViewInfo.Name
+    # HKCU (user-level installations)
+    $AllKeys += Get-UninstallKeys -Hive ([Microsoft.Win32.RegistryHive]::CurrentUser) -View $ViewInfo.View -ViewName $ViewInfo.Name
+}
+
+Write-CMTraceLog -Message "[Initialization] Found $($AllKeys.Count) registry keys to check" -Type "INFO"
+
+$Found = $false
+$InstalledVersion = $null
+$DisplayName = $null
+
+# Check all registry keys to find matching DisplayName and version
+foreach ($KeyInfo in $AllKeys) {
+    try {
+        $Key = $KeyInfo.Key
+        $DisplayNameValue = $Key.GetValue("DisplayName")
+        $VersionValue = $Key.GetValue("DisplayVersion")
+
+        if ($DisplayNameValue -eq $AppName) {
+            $RegKeyPath = $KeyInfo.Path
+
+            # Check if installer type matches (MSI vs non-MSI)
+            # MSI installers: strict matching - only accept MSI registry entries
+            # Non-MSI installers: permissive - accept any entry (EXEs may use embedded MSIs)
+            $IsMSIEntry = Test-IsMSIInstallation -RegKey $Key
+            if ($IsMSIInstaller -and -not $IsMSIEntry) {
+                # Building from MSI, but registry entry is not MSI - skip
+                Write-CMTraceLog -Message "[Detection] Type mismatch: $DisplayNameValue (Found: Non-MSI, Expected: MSI, Path: $RegKeyPath)" -Type "INFO"
+                continue
+            }
+            # Note: Non-MSI installers accept ANY registry entry (MSI or non-MSI)
+            # because EXE installers often wrap embedded MSIs that set WindowsInstaller=1
+
+            $DisplayName = $DisplayNameValue
+            $InstalledVersion = $VersionValue
+
+            Write-CMTraceLog -Message "[Detection] Match found: $DisplayName (Found: $(if ($InstalledVersion) { $InstalledVersion } else { 'None' }), Type: $(if ($IsMSIEntry) { 'MSI' } else { 'Non-MSI' }), Arch: $($KeyInfo.View), Path: $RegKeyPath)" -Type "INFO"
+
+            if ($InstalledVersion) {
+                $VersionSatisfied = if ($ExactMatch) {
+                    $InstalledVersion -eq $ExpectedVersion
+                } else {
+                    (Compare-VersionString -LeftVersion $InstalledVersion -RightVersion $ExpectedVersion) -ge 0
+                }
+                if ($VersionSatisfied) {
+                    Write-CMTraceLog -Message "[Detection] Version check passed: $InstalledVersion $(if ($ExactMatch) { '=' } else { '>=' }) $ExpectedVersion" -Type "INFO"
+                    $Found = $true
+                    break
+                } else {
+                    Write-CMTraceLog -Message "[Detection] Version check not met: $InstalledVersion $(if ($ExactMatch) { '!=' } else { '<' }) $ExpectedVersion" -Type "INFO"
+                }
+            } else {
+                Write-CMTraceLog -Message "[Detection] No version found: $DisplayName (Path: $RegKeyPath)" -Type "WARNING"
+            }
+        }
+    } catch {
+        Write-CMTraceLog -Message "[Detection] Error checking registry path $($KeyInfo.Path) : $($_.Exception.Message)" -Type "ERROR"
+    }
+}
+
+if ($Found) {
+    Write-CMTraceLog -Message "[Result] Detected: $AppName (Found: $InstalledVersion, Expected: $(if ($ExactMatch) { '=' } else { '>=' }) $ExpectedVersion, Type: $(if ($IsMSIInstaller) { 'MSI' } else { 'Non-MSI' }), Arch: $ExpectedArchitecture, Mode: $(if ($ExactMatch) { 'Exact' } else { 'Minimum' }))" -Type "INFO"
+    Write-Output "Installed"
+    exit 0
+} else {
+    $FoundVersion = if ($InstalledVersion) { $InstalledVersion } else { "None" }
+    Write-CMTraceLog -Message "[Result] Not Detected: $AppName (Found: $FoundVersion, Expected: $(if ($ExactMatch) { '=' } else { '>=' }) $ExpectedVersion, Type: $(if ($IsMSIInstaller) { 'MSI' } else { 'Non-MSI' }), Arch: $ExpectedArchitecture, Mode: $(if ($ExactMatch) { 'Exact' } else { 'Minimum' }))" -Type "WARNING"
+    exit 1
+}
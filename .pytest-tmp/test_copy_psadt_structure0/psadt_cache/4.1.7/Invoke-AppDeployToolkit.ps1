@@ -0,0 +1 @@
+# fake template
\ No newline at end of file
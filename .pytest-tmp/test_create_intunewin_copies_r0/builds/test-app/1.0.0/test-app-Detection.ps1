@@ -0,0 +1 @@
+detection script
\ No newline at end of file
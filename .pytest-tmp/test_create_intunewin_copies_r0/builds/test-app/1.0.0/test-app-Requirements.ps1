@@ -0,0 +1 @@
+requirements script
\ No newline at end of file
@@ -0,0 +1 @@
+# script
\ No newline at end of file
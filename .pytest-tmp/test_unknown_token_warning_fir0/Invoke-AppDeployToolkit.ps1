@@ -0,0 +1,12 @@
+$adtSession = @{
+    AppName = ''
+    AppVersion = ''
+}
+
+function Install-ADTDeployment {
+    ## <Perform Installation tasks here>
+}
+
+function Uninstall-ADTDeployment {
+    ## <Perform Uninstallation tasks here>
+}
@@ -0,0 +1 @@
+# requirements
\ No newline at end of file
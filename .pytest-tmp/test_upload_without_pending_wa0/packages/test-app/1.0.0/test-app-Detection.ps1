@@ -0,0 +1 @@
+# detection
\ No newline at end of file
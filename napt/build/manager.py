@@ -867,7 +867,10 @@ def _generate_requirements_script(
 
 
 def _sha256_file(path: Path) -> str:
-    """Computes the SHA-256 hex digest of a file with chunked reads.
+    """Computes the SHA-256 hex digest of a file.
+
+    Uses ``hashlib.file_digest``, which feeds the file to OpenSSL through
+    a reused buffer instead of allocating a bytes object per chunk.
 
     Args:
         path: File to hash.
@@ -876,11 +879,8 @@ def _sha256_file(path: Path) -> str:
         SHA-256 hex digest string.
 
     """
-    sha = hashlib.sha256()
     with open(path, "rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            sha.update(chunk)
-    return sha.hexdigest()
+        return hashlib.file_digest(f, "sha256").hexdigest()
 
 
 def _write_build_manifest(
@@ -82,6 +82,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+import functools
 from pathlib import Path
 from typing import Literal
 
@@ -92,7 +93,7 @@
 ArchitectureMode = Literal["x86", "x64", "arm64", "any"]
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DetectionConfig:
     """Configuration for registry-based detection script generation.
 
@@ -132,7 +133,7 @@ class DetectionConfig:
     use_wildcard: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RequirementsConfig:
     """Configuration for registry-based requirements script generation.
 
@@ -169,6 +170,53 @@ class RequirementsConfig:
     use_wildcard: bool = False
 
 
+@functools.lru_cache(maxsize=128)
+def _render_detection_script(config: DetectionConfig) -> bytes:
+    """Renders the detection script for a config as UTF-8 bytes.
+
+    Results are memoized per config. DetectionConfig is frozen, so every
+    field that affects the script is part of the cache key and rebuilding
+    an unchanged app skips template substitution and encoding.
+
+    Args:
+        config: Detection configuration (app name, version, logging settings).
+
+    Returns:
+        Encoded detection script content.
+
+    """
+    from napt.build._ps_templates import (
+        _load_ps_template,
+        escape_ps_string,
+        substitute_ps_template,
+    )
+
+    template = _load_ps_template("registry_detection_script.ps1")
+    script_content = substitute_ps_template(
+        template,
+        {
+            "$NaptAppName": escape_ps_string(config.app_name),
+            "$NaptVersion": escape_ps_string(config.version),
+            "$NaptExactMatch": "$True" if config.exact_match else "$False",
+            "$NaptLogRotationMb": str(config.log_rotation_mb),
+            "$NaptIsMsiInstaller": "$True" if config.is_msi_installer else "$False",
+            "$NaptExpectedArchitecture": config.expected_architecture,
+            "$NaptScriptType": "Detection",
+            "$NaptLogBaseName": "NAPTDetections",
+            "$NaptFallbackScriptName": "detection.ps1",
+        },
+    )
+
+    # Template defaults to -like; replace with -eq for exact matching
+    if not config.use_wildcard:
+        script_content = script_content.replace(
+            "$DisplayNameValue -like $AppName",
+            "$DisplayNameValue -eq $AppName",
+        )
+
+    return script_content.encode("utf-8")
+
+
 def generate_detection_script(config: DetectionConfig, output_path: Path) -> Path:
     """Generates PowerShell detection script for Intune Win32 app.
 
@@ -208,46 +256,32 @@ def generate_detection_script(config: DetectionConfig, output_path: Path) -> Pat
             ```
 
     """
-    from napt.build._ps_templates import (
-        _load_ps_template,
-        escape_ps_string,
-        substitute_ps_template,
-    )
     from napt.logging import get_global_logger
 
     logger = get_global_logger()
 
     logger.verbose("DETECTION", f"Generating detection script: {output_path.name}")
 
-    template = _load_ps_template("registry_detection_script.ps1")
-    script_content = substitute_ps_template(
-        template,
-        {
-            "$NaptAppName": escape_ps_string(config.app_name),
-            "$NaptVersion": escape_ps_string(config.version),
-            "$NaptExactMatch": "$True" if config.exact_match else "$False",
-            "$NaptLogRotationMb": str(config.log_rotation_mb),
-            "$NaptIsMsiInstaller": "$True" if config.is_msi_installer else "$False",
-            "$NaptExpectedArchitecture": config.expected_architecture,
-            "$NaptScriptType": "Detection",
-            "$NaptLogBaseName": "NAPTDetections",
-            "$NaptFallbackScriptName": "detection.ps1",
-        },
-    )
+    script_bytes = _render_detection_script(config)
 
-    # Template defaults to -like; replace with -eq for exact matching
-    if not config.use_wildcard:
-        script_content = script_content.replace(
-            "$DisplayNameValue -like $AppName",
-            "$DisplayNameValue -eq $AppName",
-        )
-
-    # Ensure output directory exists
-    output_path.parent.mkdir(parents=True, exist_ok=True)
+    # Leave an identical script untouched (size check avoids reading most
+    # changed files)
+    if (
+        output_path.is_file()
+        and output_path.stat().st_size == len(script_bytes)
+        and output_path.read_bytes() == script_bytes
+    ):
+        logger.verbose("DETECTION", f"Detection script unchanged: {output_path}")
+        return output_path
 
     try:
-        script_bytes = script_content.encode("utf-8")
-        output_path.write_bytes(script_bytes)
+        # The build directory usually exists already; only create it when
+        # the first write attempt reports it missing
+        try:
+            output_path.write_bytes(script_bytes)
+        except FileNotFoundError:
+            output_path.parent.mkdir(parents=True, exist_ok=True)
+            output_path.write_bytes(script_bytes)
         logger.verbose("DETECTION", f"Detection script written to: {output_path}")
     except OSError as err:
         raise OSError(
@@ -90,6 +90,7 @@
 from napt.config import load_effective_config
 from napt.config.defaults import ORG_YAML_TEMPLATE
 from napt.discovery.manager import discover_recipe
+from napt.download import close_shared_session
 from napt.exceptions import (
     AuthError,
     ConfigError,
@@ -1607,8 +1608,12 @@ def main() -> None:
     # Parse and dispatch
     args = parser.parse_args()
 
-    # Call the appropriate command handler
-    exit_code = args.func(args)
+    # Call the appropriate command handler, releasing pooled HTTP
+    # connections however it exits
+    try:
+        exit_code = args.func(args)
+    finally:
+        close_shared_session()
     sys.exit(exit_code)
 
 
@@ -351,12 +351,14 @@ def _print_yaml_content(data: dict[str, Any], indent: int = 0) -> None:
     """Print YAML content in a readable format for debug mode."""
     import yaml
 
-    from napt.logging import get_global_logger
+    from napt.logging import debug_enabled, get_global_logger
 
     logger = get_global_logger()
+    # Skip the YAML dump entirely unless it would be printed
+    if not debug_enabled(logger):
+        return
 
     # Convert to YAML string and log with indentation
-    # The logger.debug() call will only print if debug mode is enabled
     yaml_str = yaml.dump(data, default_flow_style=False, sort_keys=False)
     for line in yaml_str.split("\n"):
         if line.strip():  # Skip empty lines
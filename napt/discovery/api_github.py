@@ -45,6 +45,13 @@
         rate limit from 60 to 5000 requests/hour. Supports ``${ENV_VAR}``
         expansion. Public repos do not require any special permissions.
 
+Conditional Requests:
+    The release response's ETag and Last-Modified validators are saved in
+    the discovery cache with the release fields discovery reads. The next
+    run sends them as ``If-None-Match`` / ``If-Modified-Since``; on HTTP
+    304 the cached fields are parsed again with the recipe's current
+    patterns, so pattern edits take effect without a full re-fetch.
+
 Note:
     GitHub returns the most recent release first. If no asset matches,
     or the latest release is a pre-release while ``prerelease: false``,
@@ -54,27 +61,87 @@
 
 from __future__ import annotations
 
-import os
+from collections.abc import Mapping
+from datetime import UTC, datetime
+import functools
 import re
 from typing import Any
 
 import requests
 
-from napt.discovery.base import RemoteVersion
-from napt.download import make_session
+from napt.discovery.base import (
+    RemoteVersion,
+    expand_env_reference,
+    response_validators,
+    reusable_response,
+    revalidation_headers,
+)
+from napt.download import get_shared_session
 from napt.exceptions import ConfigError, NetworkError
+from napt.logging import get_global_logger
 
 from .base import register_strategy
 
 # Strategy-specific defaults for optional recipe fields.
 _DEFAULT_VERSION_PATTERN = r"v?([0-9.]+)"
+# Characters matched by the default pattern's capture group.
+_VERSION_CHARS = "0123456789."
 _DEFAULT_PRERELEASE = False
 
 
+@functools.lru_cache(maxsize=256)
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compiles a recipe regex once per process.
+
+    Recipes share patterns (most use the default ``version_pattern``), and
+    validation and discovery compile the same strings, so compiled
+    patterns are memoized by pattern text.
+
+    Args:
+        pattern: Regex source from the recipe.
+
+    Returns:
+        Compiled pattern.
+
+    Raises:
+        re.error: If the pattern is not a valid regex. Failures are not
+            cached.
+
+    """
+    return re.compile(pattern)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_version_pattern(pattern: str) -> tuple[re.Pattern[str], str | int]:
+    """Compiles a ``version_pattern`` and picks the group holding the version.
+
+    The group depends only on the pattern, so it is resolved once here
+    rather than inspected after every match.
+
+    Args:
+        pattern: ``version_pattern`` regex source from the recipe.
+
+    Returns:
+        The compiled pattern and the group to read from a match: the
+        named ``version`` group if present, else group 1 if the pattern
+        has groups, else 0 (the full match).
+
+    Raises:
+        re.error: If the pattern is not a valid regex.
+
+    """
+    compiled = _compile_pattern(pattern)
+    if "version" in compiled.groupindex:
+        return compiled, "version"
+    return compiled, 1 if compiled.groups else 0
+
+
 class ApiGithubStrategy:
     """Discovery strategy for GitHub releases."""
 
-    def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
+    def discover(
+        self, app_config: dict[str, Any], cache: dict[str, Any] | None = None
+    ) -> RemoteVersion:
         r"""Discovers the latest GitHub release version and asset download URL.
 
         Queries the GitHub releases API for the latest release of the
@@ -87,10 +154,15 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
                 ``discovery.repo`` and ``discovery.asset_pattern``,
                 plus optional ``version_pattern``, ``prerelease``, and
                 ``token`` fields.
+            cache: Cached state for this recipe. When it holds a
+                ``response_cache`` for the same release URL, its validators
+                are sent as ``If-None-Match`` / ``If-Modified-Since`` and
+                an HTTP 304 reuses the cached release data.
 
         Returns:
-            Latest version, the matched asset's download URL, and
-            ``"api_github"`` as the source identifier.
+            Latest version, the matched asset's download URL,
+            ``"api_github"`` as the source identifier, and the release
+            validators and data to cache for the next run.
 
         Raises:
             ConfigError: On missing or malformed required configuration,
@@ -99,8 +171,6 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
                 pre-releases.
 
         """
-        from napt.logging import get_global_logger
-
         logger = get_global_logger()
         # Validate configuration
         source = app_config.get("discovery", {})
@@ -109,7 +179,7 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
             raise ConfigError("api_github strategy requires 'discovery.repo' in config")
 
         # Validate repo format
-        if "/" not in repo or repo.count("/") != 1:
+        if repo.count("/") != 1:
             raise ConfigError(
                 f"Invalid repo format: {repo!r}. Expected 'owner/repository'"
             )
@@ -127,14 +197,7 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
 
         # Expand environment variables in token (e.g., ${GITHUB_TOKEN})
         if token:
-            if token.startswith("${") and token.endswith("}"):
-                env_var = token[2:-1]
-                token = os.environ.get(env_var)
-                if not token:
-                    logger.verbose(
-                        "DISCOVERY",
-                        f"Warning: Environment variable {env_var} not set",
-                    )
+            token = expand_env_reference(token)
 
         logger.verbose("DISCOVERY", "Strategy: api_github (version-first)")
         logger.verbose("DISCOVERY", f"Repository: {repo}")
@@ -149,6 +212,9 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
         headers = {
             "Accept": "application/vnd.github+json",
             "X-GitHub-Api-Version": "2022-11-28",
+            # The shared session asks for identity encoding to keep installer
+            # ETags stable; release JSON compresses well, so request gzip
+            "Accept-Encoding": "gzip, deflate",
         }
 
         # Add authentication if token provided
@@ -156,29 +222,49 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
             headers["Authorization"] = f"token {token}"
             logger.verbose("DISCOVERY", "Using authenticated API request")
 
+        # Revalidate the previous release response instead of re-fetching it
+        cached_response = reusable_response(
+            cache, api_url, {"tag_name": str, "assets": list}
+        )
+        conditional_headers = revalidation_headers(cached_response)
+        if not conditional_headers:
+            cached_response = None
+        for name, value in conditional_headers.items():
+            logger.verbose("DISCOVERY", f"Revalidating cached release: {name}: {value}")
+        headers.update(conditional_headers)
+
         logger.verbose("DISCOVERY", f"Fetching release from: {api_url}")
 
         try:
-            with make_session() as session:
-                response = session.get(api_url, headers=headers, timeout=30)
+            response = get_shared_session().get(api_url, headers=headers, timeout=30)
         except requests.exceptions.RequestException as err:
             raise NetworkError(f"Failed to fetch GitHub release: {err}") from err
 
-        if response.status_code == 404:
+        status = response.status_code
+        if status == 304 and cached_response:
+            logger.verbose(
+                "DISCOVERY", "Release not modified (HTTP 304), using cached data"
+            )
+            release_data = cached_response["body"]
+            response_cache = cached_response
+        elif status == 404:
             raise NetworkError(f"Repository {repo!r} not found or has no releases")
-        elif response.status_code == 403:
+        elif status == 403:
             raise NetworkError(
                 f"GitHub API rate limit exceeded. Consider using a token. "
-                f"Status: {response.status_code}"
+                f"Status: {status}{_rate_limit_reset_hint(response.headers)}"
             )
         elif not response.ok:
-            raise NetworkError(
-                f"GitHub API request failed: {response.status_code} "
-                f"{response.reason}"
+            raise NetworkError(f"GitHub API request failed: {status} {response.reason}")
+        else:
+            release_data = response.json()
+            validators = response_validators(response.headers)
+            response_cache = (
+                {"url": api_url, **validators, "body": _trim_release(release_data)}
+                if validators
+                else None
             )
 
-        release_data = response.json()
-
         # Check if this is a prerelease and we don't want those
         if release_data.get("prerelease", False) and not prerelease:
             raise NetworkError(
@@ -193,33 +279,34 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
 
         logger.verbose("DISCOVERY", f"Release tag: {tag_name}")
 
-        try:
-            pattern = re.compile(version_pattern)
-            match = pattern.search(tag_name)
-            if not match:
-                raise ConfigError(
-                    f"Version pattern {version_pattern!r} did not match "
-                    f"tag {tag_name!r}"
-                )
-
-            # Try to get named capture group 'version' first, else use group 1,
-            # else full match
-            if "version" in pattern.groupindex:
-                version_str = match.group("version")
-            elif pattern.groups > 0:
-                version_str = match.group(1)
-            else:
-                version_str = match.group(0)
+        # Plain "1.2.3" / "v1.2.3" tags under the default pattern need no
+        # regex: its capture group is then the tag minus the leading "v"
+        version_str = None
+        if version_pattern == _DEFAULT_VERSION_PATTERN:
+            candidate = tag_name.lstrip("v")
+            if candidate and not candidate.strip(_VERSION_CHARS):
+                version_str = candidate
 
-        except re.error as err:
-            raise ConfigError(
-                f"Invalid version_pattern regex: {version_pattern!r}"
-            ) from err
-        except (ValueError, IndexError) as err:
-            raise ConfigError(
-                f"Failed to extract version from tag {tag_name!r} "
-                f"using pattern {version_pattern!r}: {err}"
-            ) from err
+        if version_str is None:
+            try:
+                version_re, version_group = _compile_version_pattern(version_pattern)
+                match = version_re.search(tag_name)
+                if not match:
+                    raise ConfigError(
+                        f"Version pattern {version_pattern!r} did not match "
+                        f"tag {tag_name!r}"
+                    )
+
+                version_str = match.group(version_group)
+            except re.error as err:
+                raise ConfigError(
+                    f"Invalid version_pattern regex: {version_pattern!r}"
+                ) from err
+            except (ValueError, IndexError) as err:
+                raise ConfigError(
+                    f"Failed to extract version from tag {tag_name!r} "
+                    f"using pattern {version_pattern!r}: {err}"
+                ) from err
 
         logger.verbose("DISCOVERY", f"Extracted version: {version_str}")
 
@@ -233,29 +320,27 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
 
         logger.verbose("DISCOVERY", f"Release has {len(assets)} asset(s)")
 
-        # Match asset by pattern
-        matched_asset = None
+        # Match asset by pattern; the first match wins
         try:
-            pattern = re.compile(asset_pattern)
+            asset_re = _compile_pattern(asset_pattern)
         except re.error as err:
             raise ConfigError(
                 f"Invalid asset_pattern regex: {asset_pattern!r}"
             ) from err
 
-        for asset in assets:
-            asset_name = asset.get("name", "")
-            if pattern.search(asset_name):
-                matched_asset = asset
-                logger.verbose("DISCOVERY", f"Matched asset: {asset_name}")
-                break
-
-        if not matched_asset:
-            available = [a.get("name", "(unnamed)") for a in assets]
+        search = asset_re.search
+        matched_asset = next(
+            (asset for asset in assets if search(asset.get("name", ""))), None
+        )
+        if matched_asset is None:
+            available = ", ".join(a.get("name", "(unnamed)") for a in assets)
             raise ConfigError(
                 f"No assets matched pattern {asset_pattern!r}. "
-                f"Available assets: {', '.join(available)}"
+                f"Available assets: {available}"
             )
 
+        logger.verbose("DISCOVERY", f"Matched asset: {matched_asset.get('name')}")
+
         # Get download URL
         download_url = matched_asset.get("browser_download_url")
         if not download_url:
@@ -267,6 +352,7 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
             version=version_str,
             download_url=download_url,
             source="api_github",
+            response_cache=response_cache,
         )
 
     def validate_config(self, app_config: dict[str, Any]) -> list[str]:
@@ -283,53 +369,104 @@ def validate_config(self, app_config: dict[str, Any]) -> list[str]:
         """
         errors = []
         source = app_config.get("discovery", {})
+        repo = source.get("repo")
+        asset_pattern = source.get("asset_pattern")
+        version_pattern = source.get("version_pattern")
 
         # Check required fields
         if "repo" not in source:
             errors.append("Missing required field: discovery.repo")
-        elif not isinstance(source["repo"], str):
+        elif not isinstance(repo, str):
             errors.append("discovery.repo must be a string")
-        elif not source["repo"].strip():
+        elif not repo.strip():
             errors.append("discovery.repo cannot be empty")
-        else:
-            # Validate repo format
-            repo = source["repo"]
-            if repo.count("/") != 1:
-                errors.append(
-                    "discovery.repo must be in format 'owner/repo' (e.g., 'git/git')"
-                )
+        elif repo.count("/") != 1:
+            errors.append(
+                "discovery.repo must be in format 'owner/repo' (e.g., 'git/git')"
+            )
 
         if "asset_pattern" not in source:
             errors.append("Missing required field: discovery.asset_pattern")
-        elif not isinstance(source["asset_pattern"], str):
+        elif not isinstance(asset_pattern, str):
             errors.append("discovery.asset_pattern must be a string")
-        elif not source["asset_pattern"].strip():
+        elif not asset_pattern.strip():
             errors.append("discovery.asset_pattern cannot be empty")
         else:
-            # Validate regex pattern syntax
-            pattern = source["asset_pattern"]
-            import re
-
-            try:
-                re.compile(pattern)
-            except re.error as err:
-                errors.append(f"Invalid asset_pattern regex: {err}")
+            _check_regex("asset_pattern", asset_pattern, errors)
 
         # Optional fields validation
         if "version_pattern" in source:
-            if not isinstance(source["version_pattern"], str):
+            if not isinstance(version_pattern, str):
                 errors.append("discovery.version_pattern must be a string")
             else:
-                pattern = source["version_pattern"]
-                import re
-
-                try:
-                    re.compile(pattern)
-                except re.error as err:
-                    errors.append(f"Invalid version_pattern regex: {err}")
+                _check_regex("version_pattern", version_pattern, errors)
 
         return errors
 
 
+def _rate_limit_reset_hint(headers: Mapping[str, str]) -> str:
+    """Describes when an exhausted GitHub rate limit resets.
+
+    Args:
+        headers: Response headers from the rejected request.
+
+    Returns:
+        A message suffix such as ``" (limit resets at 14:05:00 UTC)"``, or
+        an empty string when the response carries no usable
+        ``X-RateLimit-Reset`` header or the limit is not exhausted.
+
+    """
+    if headers.get("X-RateLimit-Remaining") != "0":
+        return ""
+    try:
+        reset_at = datetime.fromtimestamp(int(headers["X-RateLimit-Reset"]), tz=UTC)
+    except (KeyError, ValueError, OverflowError, OSError):
+        return ""
+    return f" (limit resets at {reset_at:%H:%M:%S} UTC)"
+
+
+def _check_regex(field: str, pattern: str, errors: list[str]) -> None:
+    """Appends an error to ``errors`` if ``pattern`` is not a valid regex.
+
+    Args:
+        field: Recipe field name, used in the error message.
+        pattern: Regex source to check.
+        errors: Error list being built by ``validate_config``.
+
+    """
+    try:
+        _compile_pattern(pattern)
+    except re.error as err:
+        errors.append(f"Invalid {field} regex: {err}")
+
+
+def _trim_release(release_data: dict[str, Any]) -> dict[str, Any]:
+    """Reduces a release payload to the fields discovery reads.
+
+    The trimmed copy is what gets cached for HTTP 304 reuse, so the
+    discovery cache does not carry uploader details, download counts,
+    and other fields discovery never reads.
+
+    Args:
+        release_data: Decoded GitHub release JSON.
+
+    Returns:
+        Release data with only ``tag_name``, ``prerelease``, and each
+        asset's ``name`` and ``browser_download_url``.
+
+    """
+    return {
+        "tag_name": release_data.get("tag_name", ""),
+        "prerelease": release_data.get("prerelease", False),
+        "assets": [
+            {
+                "name": asset.get("name", ""),
+                "browser_download_url": asset.get("browser_download_url"),
+            }
+            for asset in release_data.get("assets", [])
+        ],
+    }
+
+
 # Register this strategy when the module is imported
 register_strategy("api_github", ApiGithubStrategy)
@@ -59,6 +59,21 @@
         ``method: POST``.
     - **timeout** (optional, default 30): Request timeout in seconds.
 
+Conditional Requests:
+    For ``GET`` endpoints that send an ETag or Last-Modified header, the
+    validators and the extracted version and download URL are saved in
+    the discovery cache. The next run sends them as ``If-None-Match`` /
+    ``If-Modified-Since``; on HTTP 304 the cached values are reused
+    without transferring or parsing the response. Changing either path
+    in the recipe discards the cached values.
+
+Response Size:
+    Responses larger than 16 MiB raise
+    [NetworkError][napt.exceptions.NetworkError] instead of being
+    buffered and parsed, whether the size comes from ``Content-Length``
+    or from the body itself. This usually means ``api_url`` points at an
+    installer or web page rather than a JSON endpoint.
+
 Note:
     JSONPath uses the ``jsonpath-ng`` library. Environment-variable
     expansion (``${VAR}``) is applied to string values in ``headers``.
@@ -68,28 +83,68 @@
 
 from __future__ import annotations
 
+import functools
 import json
-import os
 from typing import Any
 
 from jsonpath_ng import parse as jsonpath_parse
 import requests
 
-from napt.discovery.base import RemoteVersion
-from napt.download import make_session
+from napt.discovery.base import (
+    RemoteVersion,
+    expand_env_reference,
+    response_validators,
+    reusable_response,
+    revalidation_headers,
+)
+from napt.download import get_shared_session
 from napt.exceptions import ConfigError, NetworkError
+from napt.logging import debug_enabled, get_global_logger
 
 from .base import register_strategy
 
 # Strategy-specific defaults for optional recipe fields.
 _DEFAULT_METHOD = "GET"
 _DEFAULT_TIMEOUT = 30
+# Upper bound on a response body; a metadata endpoint never needs more.
+_MAX_RESPONSE_BYTES = 16 * 1024 * 1024
+
+# Required string fields, and whether each is a JSONPath expression.
+_REQUIRED_FIELDS = (
+    ("api_url", False),
+    ("version_path", True),
+    ("download_url_path", True),
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _parse_path(expression: str) -> Any:
+    """Parses a JSONPath expression once per process.
+
+    jsonpath-ng builds its parser on every ``parse`` call, which costs far
+    more than evaluating the expression. Validation and discovery parse
+    the same recipe strings, so parsed expressions are memoized by text.
+
+    Args:
+        expression: JSONPath expression from the recipe.
+
+    Returns:
+        Parsed JSONPath expression, ready for ``find``.
+
+    Raises:
+        Exception: Whatever jsonpath-ng raises for invalid syntax.
+            Failures are not cached.
+
+    """
+    return jsonpath_parse(expression)
 
 
 class ApiJsonStrategy:
     """Discovery strategy for JSON API endpoints."""
 
-    def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
+    def discover(
+        self, app_config: dict[str, Any], cache: dict[str, Any] | None = None
+    ) -> RemoteVersion:
         """Discovers version and download URL from a JSON API endpoint.
 
         Calls the configured ``api_url`` and extracts the version and
@@ -102,10 +157,15 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
                 ``discovery.api_url``, ``discovery.version_path``, and
                 ``discovery.download_url_path``, plus optional
                 ``method``, ``headers``, and ``body`` fields.
+            cache: Cached state for this recipe. When it holds a
+                ``response_cache`` for the same GET endpoint and paths,
+                its validators are sent and an HTTP 304 reuses the cached
+                version and download URL.
 
         Returns:
-            Discovered version, download URL, and ``"api_json"`` as
-            the source identifier.
+            Discovered version, download URL, ``"api_json"`` as the
+            source identifier, and the response validators to cache for
+            the next run.
 
         Raises:
             ConfigError: On missing required configuration or when
@@ -113,8 +173,6 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
             NetworkError: On API request failure.
 
         """
-        from napt.logging import get_global_logger
-
         logger = get_global_logger()
         # Validate configuration
         source = app_config.get("discovery", {})
@@ -151,63 +209,89 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
         logger.verbose("DISCOVERY", f"Version path: {version_path}")
         logger.verbose("DISCOVERY", f"Download URL path: {download_url_path}")
 
-        # Expand environment variables in headers
+        # Expand environment variables in headers; unset ones are dropped
         expanded_headers = {}
         for key, value in headers.items():
-            if (
-                isinstance(value, str)
-                and value.startswith("${")
-                and value.endswith("}")
-            ):
-                env_var = value[2:-1]
-                env_value = os.environ.get(env_var)
-                if not env_value:
-                    logger.verbose(
-                        "DISCOVERY",
-                        f"Warning: Environment variable {env_var} not set",
-                    )
-                else:
-                    expanded_headers[key] = env_value
-            else:
-                expanded_headers[key] = value
+            if isinstance(value, str):
+                value = expand_env_reference(value)
+                if value is None:
+                    continue
+            expanded_headers[key] = value
+
+        # Revalidate the previous response (GET only; POST is not cacheable)
+        cached_response = None
+        paths = [version_path, download_url_path]
+        if method == "GET":
+            cached_response = reusable_response(
+                cache,
+                api_url,
+                {"version": str, "download_url": str},
+                paths=paths,
+            )
+        conditional_headers = revalidation_headers(cached_response)
+        if not conditional_headers:
+            cached_response = None
+        for name, value in conditional_headers.items():
+            logger.verbose(
+                "DISCOVERY", f"Revalidating cached response: {name}: {value}"
+            )
+        expanded_headers.update(conditional_headers)
 
         # Make API request
         logger.verbose("DISCOVERY", f"Calling API: {method} {api_url}")
         try:
             # GETs retry transient failures through the shared session;
             # POSTs are sent once (a vendor API's idempotency is unknown).
-            with make_session() as session:
-                response = session.request(
-                    method,
-                    api_url,
-                    headers=expanded_headers,
-                    json=body if method == "POST" else None,
-                    timeout=timeout,
-                )
+            response = get_shared_session().request(
+                method,
+                api_url,
+                headers=expanded_headers,
+                json=body if method == "POST" else None,
+                timeout=timeout,
+                stream=True,
+            )
         except requests.exceptions.RequestException as err:
             raise NetworkError(f"Failed to call API: {err}") from err
 
-        if not response.ok:
-            raise NetworkError(
-                f"API request failed: {response.status_code} {response.reason}"
-            )
+        with response:
+            if response.status_code == 304 and cached_response:
+                logger.verbose(
+                    "DISCOVERY",
+                    "API response not modified (HTTP 304), using cached data",
+                )
+                return RemoteVersion(
+                    version=cached_response["body"]["version"],
+                    download_url=cached_response["body"]["download_url"],
+                    source="api_json",
+                    response_cache=cached_response,
+                )
 
-        logger.verbose("DISCOVERY", f"API response: {response.status_code} OK")
+            if not response.ok:
+                raise NetworkError(
+                    f"API request failed: {response.status_code} {response.reason}"
+                )
+
+            logger.verbose("DISCOVERY", f"API response: {response.status_code} OK")
+            content = _read_capped(response)
 
         # Parse JSON response
         try:
-            json_data = response.json()
-        except json.JSONDecodeError as err:
+            json_data = json.loads(content)
+        except ValueError as err:
+            snippet = content[:200].decode("utf-8", errors="replace")
             raise NetworkError(
-                f"Invalid JSON response from API. Response: {response.text[:200]}"
+                f"Invalid JSON response from API. Response: {snippet}"
             ) from err
 
-        logger.debug("DISCOVERY", f"JSON response: {json.dumps(json_data, indent=2)}")
+        if debug_enabled(logger):
+            logger.debug(
+                "DISCOVERY", f"JSON response: {json.dumps(json_data, indent=2)}"
+            )
 
         # Extract version using JSONPath
         logger.verbose("DISCOVERY", f"Extracting version from path: {version_path}")
         try:
-            version_expr = jsonpath_parse(version_path)
+            version_expr = _parse_path(version_path)
             version_matches = version_expr.find(json_data)
 
             if not version_matches:
@@ -231,7 +315,7 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
             "DISCOVERY", f"Extracting download URL from path: {download_url_path}"
         )
         try:
-            url_expr = jsonpath_parse(download_url_path)
+            url_expr = _parse_path(download_url_path)
             url_matches = url_expr.find(json_data)
 
             if not url_matches:
@@ -251,10 +335,21 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
 
         logger.verbose("DISCOVERY", f"Download URL: {download_url}")
 
+        validators = response_validators(response.headers) if method == "GET" else {}
         return RemoteVersion(
             version=version_str,
             download_url=download_url,
             source="api_json",
+            response_cache=(
+                {
+                    "url": api_url,
+                    "paths": paths,
+                    **validators,
+                    "body": {"version": version_str, "download_url": download_url},
+                }
+                if validators
+                else None
+            ),
         )
 
     def validate_config(self, app_config: dict[str, Any]) -> list[str]:
@@ -272,43 +367,20 @@ def validate_config(self, app_config: dict[str, Any]) -> list[str]:
         errors = []
         source = app_config.get("discovery", {})
 
-        # Check required fields
-        if "api_url" not in source:
-            errors.append("Missing required field: discovery.api_url")
-        elif not isinstance(source["api_url"], str):
-            errors.append("discovery.api_url must be a string")
-        elif not source["api_url"].strip():
-            errors.append("discovery.api_url cannot be empty")
-
-        if "version_path" not in source:
-            errors.append("Missing required field: discovery.version_path")
-        elif not isinstance(source["version_path"], str):
-            errors.append("discovery.version_path must be a string")
-        elif not source["version_path"].strip():
-            errors.append("discovery.version_path cannot be empty")
-        else:
-            # Validate JSONPath syntax
-            from jsonpath_ng import parse as jsonpath_parse
-
-            try:
-                jsonpath_parse(source["version_path"])
-            except Exception as err:
-                errors.append(f"Invalid version_path JSONPath: {err}")
-
-        if "download_url_path" not in source:
-            errors.append("Missing required field: discovery.download_url_path")
-        elif not isinstance(source["download_url_path"], str):
-            errors.append("discovery.download_url_path must be a string")
-        elif not source["download_url_path"].strip():
-            errors.append("discovery.download_url_path cannot be empty")
-        else:
-            # Validate JSONPath syntax
-            from jsonpath_ng import parse as jsonpath_parse
-
-            try:
-                jsonpath_parse(source["download_url_path"])
-            except Exception as err:
-                errors.append(f"Invalid download_url_path JSONPath: {err}")
+        # Check required fields; JSONPath fields must also parse
+        for field, is_jsonpath in _REQUIRED_FIELDS:
+            value = source.get(field)
+            if field not in source:
+                errors.append(f"Missing required field: discovery.{field}")
+            elif not isinstance(value, str):
+                errors.append(f"discovery.{field} must be a string")
+            elif not value.strip():
+                errors.append(f"discovery.{field} cannot be empty")
+            elif is_jsonpath:
+                try:
+                    _parse_path(value)
+                except Exception as err:
+                    errors.append(f"Invalid {field} JSONPath: {err}")
 
         # Optional fields validation
         if "method" in source:
@@ -327,5 +399,42 @@ def validate_config(self, app_config: dict[str, Any]) -> list[str]:
         return errors
 
 
+def _read_capped(response: requests.Response) -> bytes:
+    """Reads a streamed response body, refusing oversized payloads.
+
+    A misbehaving endpoint (or a recipe pointing at an installer rather
+    than its metadata API) would otherwise be buffered into memory in
+    full before JSON parsing fails.
+
+    Args:
+        response: Response opened with ``stream=True``.
+
+    Returns:
+        The (decompressed) response body.
+
+    Raises:
+        NetworkError: If the body exceeds ``_MAX_RESPONSE_BYTES``, or the
+            connection fails while it is being read.
+
+    """
+    too_large = (
+        f"API response exceeds {_MAX_RESPONSE_BYTES} bytes; "
+        f"check that discovery.api_url points at a JSON endpoint"
+    )
+    declared = response.headers.get("Content-Length", "")
+    if declared.isdigit() and int(declared) > _MAX_RESPONSE_BYTES:
+        raise NetworkError(too_large)
+
+    content = bytearray()
+    try:
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            content += chunk
+            if len(content) > _MAX_RESPONSE_BYTES:
+                raise NetworkError(too_large)
+    except requests.exceptions.RequestException as err:
+        raise NetworkError(f"Failed to read API response: {err}") from err
+    return bytes(content)
+
+
 # Register this strategy when the module is imported
 register_strategy("api_json", ApiJsonStrategy)
@@ -34,8 +34,11 @@
 Design Philosophy:
     - Strategies are ``typing.Protocol`` types. Implementations are
         matched structurally; no inheritance is required.
-    - Strategies are pure functions of configuration. They have no state,
-        no I/O of files, and no awareness of the cache.
+    - Strategies are pure functions of configuration. They have no state
+        and no I/O of files. A strategy that issues conditional requests
+        reads its validator from the cache entry the orchestrator passes
+        in and returns the replacement on its result; it never reads or
+        writes the cache file itself.
     - Registration is a side effect of importing each strategy module.
     - The [resolve_with_cache][napt.discovery.base.resolve_with_cache]
         helper turns a [RemoteVersion][napt.discovery.base.RemoteVersion]
@@ -51,7 +54,7 @@
         )
 
         class GitlabReleasesStrategy:
-            def discover(self, app_config):
+            def discover(self, app_config, cache=None):
                 # Query GitLab API and parse the response...
                 return RemoteVersion(
                     version="1.2.3",
@@ -72,7 +75,9 @@ def validate_config(self, app_config):
 
 from __future__ import annotations
 
+from collections.abc import Mapping
 from dataclasses import dataclass
+import os
 from pathlib import Path
 from typing import Any, Protocol
 
@@ -82,7 +87,7 @@ def validate_config(self, app_config):
 from napt.versioning import is_newer
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class RemoteVersion:
     """Version and download URL discovered from a remote source.
 
@@ -97,14 +102,21 @@ class RemoteVersion:
         download_url: URL the installer can be fetched from.
         source: Name of the strategy that produced this result, used
             for logging and result reporting (for example, ``"api_github"``).
+        response_cache: Conditional-request record for the metadata
+            response (``url``, ``etag``, ``last_modified``, and in ``body``
+            whatever the strategy needs to answer from an HTTP 304),
+            persisted by the orchestrator so the next run can revalidate
+            it. None when the strategy does not use conditional requests
+            or the server sent no validator.
     """
 
     version: str
     download_url: str
     source: str
+    response_cache: dict[str, Any] | None = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StrategyResult:
     """Resolved discovery result, ready to be saved to state.
 
@@ -129,6 +141,8 @@ class StrategyResult:
             future runs know where to re-fetch from if needed.
         cached: True when the file was reused from cache; False when it
             was downloaded.
+        response_cache: Conditional-request record carried over from
+            [RemoteVersion][napt.discovery.base.RemoteVersion], or None.
     """
 
     version: str
@@ -138,6 +152,7 @@ class StrategyResult:
     headers: dict[str, str]
     download_url: str
     cached: bool
+    response_cache: dict[str, Any] | None = None
 
 
 class DiscoveryStrategy(Protocol):
@@ -152,11 +167,16 @@ class DiscoveryStrategy(Protocol):
     method with the signatures below.
     """
 
-    def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
+    def discover(
+        self, app_config: dict[str, Any], cache: dict[str, Any] | None = None
+    ) -> RemoteVersion:
         """Discovers the latest version and its download URL.
 
         Args:
             app_config: Merged recipe configuration dict.
+            cache: Cached state for this recipe from the previous run, or
+                None. Strategies that issue conditional requests read
+                ``response_cache`` from it; others ignore it.
 
         Returns:
             Latest version, the URL it can be downloaded from, and the
@@ -185,6 +205,7 @@ def validate_config(self, app_config: dict[str, Any]) -> list[str]:
 
 
 _STRATEGY_REGISTRY: dict[str, type[DiscoveryStrategy]] = {}
+_STRATEGY_INSTANCES: dict[str, DiscoveryStrategy] = {}
 
 
 def register_strategy(name: str, strategy_class: type[DiscoveryStrategy]) -> None:
@@ -210,12 +231,14 @@ def register_strategy(name: str, strategy_class: type[DiscoveryStrategy]) -> Non
 
     """
     _STRATEGY_REGISTRY[name] = strategy_class
+    _STRATEGY_INSTANCES.pop(name, None)
 
 
 def get_strategy(name: str) -> DiscoveryStrategy:
     """Returns a discovery strategy instance by name from the registry.
 
-    Strategies are instantiated on-demand because they are stateless. The
+    Strategies are stateless, so each is instantiated on first lookup and
+    the instance is reused until the name is registered again. The
     strategy's module must already be imported for registration to have
     happened.
 
@@ -223,7 +246,7 @@ def get_strategy(name: str) -> DiscoveryStrategy:
         name: Registered strategy name. Case-sensitive.
 
     Returns:
-        New instance of the requested strategy.
+        Shared instance of the requested strategy.
 
     Raises:
         ConfigError: If the name is not registered. The message lists
@@ -231,11 +254,125 @@ def get_strategy(name: str) -> DiscoveryStrategy:
 
     """
     if name not in _STRATEGY_REGISTRY:
-        available = ", ".join(_STRATEGY_REGISTRY.keys())
+        available = ", ".join(sorted(_STRATEGY_REGISTRY))
         raise ConfigError(
             f"Unknown discovery strategy: {name!r}. Available: {available or '(none)'}"
         )
-    return _STRATEGY_REGISTRY[name]()
+    strategy = _STRATEGY_INSTANCES.get(name)
+    if strategy is None:
+        strategy = _STRATEGY_INSTANCES[name] = _STRATEGY_REGISTRY[name]()
+    return strategy
+
+
+def expand_env_reference(value: str) -> str | None:
+    """Expands a whole-value ``${VAR}`` reference from the environment.
+
+    Recipes reference secrets (``discovery.token``, ``discovery.headers``
+    values) as ``${VAR}`` so they stay out of YAML. Only values that are
+    entirely a reference are expanded; anything else is returned as-is.
+
+    Args:
+        value: Raw recipe value.
+
+    Returns:
+        The value unchanged when it is not a reference, the environment
+        variable's value when it is, or None when the variable is unset
+        or empty.
+
+    """
+    if not (value.startswith("${") and value.endswith("}")):
+        return value
+
+    env_var = value[2:-1]
+    env_value = os.environ.get(env_var)
+    if not env_value:
+        get_global_logger().verbose(
+            "DISCOVERY", f"Warning: Environment variable {env_var} not set"
+        )
+        return None
+    return env_value
+
+
+def reusable_response(
+    cache: dict[str, Any] | None,
+    url: str,
+    body_fields: Mapping[str, type],
+    **expected: Any,
+) -> dict[str, Any] | None:
+    """Selects the cached response record a strategy may revalidate.
+
+    The record comes from ``cache/discovery.json``, which may be truncated
+    or hand-edited. Anything other than a record for this URL whose
+    ``body`` carries every field a 304 reuse reads is ignored, so the
+    request falls back to a full fetch instead of failing on the record.
+
+    Args:
+        cache: Cached state for this recipe, or None.
+        url: The URL about to be requested.
+        body_fields: Field names the ``body`` dict must hold, mapped to
+            their expected types.
+        **expected: Further top-level record keys that must equal the
+            given values (e.g. the configured JSONPaths).
+
+    Returns:
+        The ``response_cache`` record, or None when there is none or it
+        does not match.
+
+    """
+    record = (cache or {}).get("response_cache")
+    if not isinstance(record, dict) or record.get("url") != url:
+        return None
+    if any(record.get(key) != value for key, value in expected.items()):
+        return None
+    body = record.get("body")
+    if not isinstance(body, dict) or not all(
+        isinstance(body.get(name), kind) for name, kind in body_fields.items()
+    ):
+        return None
+    return record
+
+
+def revalidation_headers(response_cache: dict[str, Any] | None) -> dict[str, str]:
+    """Builds conditional-request headers from a cached response record.
+
+    Args:
+        response_cache: ``response_cache`` record saved by a previous run,
+            or None.
+
+    Returns:
+        ``If-None-Match`` and/or ``If-Modified-Since`` for the validators
+        the record holds. Empty when there is no record or it holds no
+        validator.
+
+    """
+    if not response_cache:
+        return {}
+    headers = {}
+    if response_cache.get("etag"):
+        headers["If-None-Match"] = response_cache["etag"]
+    if response_cache.get("last_modified"):
+        headers["If-Modified-Since"] = response_cache["last_modified"]
+    return headers
+
+
+def response_validators(headers: Mapping[str, str]) -> dict[str, str]:
+    """Extracts cache validators from HTTP response headers.
+
+    Args:
+        headers: Response headers (case-insensitive mapping).
+
+    Returns:
+        ``etag`` and/or ``last_modified`` for the validators the server
+        sent, ready to merge into a ``response_cache`` record. Empty when
+        the response is not revalidatable.
+
+    """
+    validators = {}
+    if headers.get("ETag"):
+        validators["etag"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["last_modified"] = headers["Last-Modified"]
+    return validators
 
 
 def resolve_with_cache(
@@ -291,6 +428,7 @@ def resolve_with_cache(
                     headers={},
                     download_url=info.download_url,
                     cached=True,
+                    response_cache=info.response_cache,
                 )
             logger.warning(
                 "CACHE",
@@ -312,4 +450,5 @@ def resolve_with_cache(
         headers=dl.headers,
         download_url=info.download_url,
         cached=False,
+        response_cache=info.response_cache,
     )
@@ -46,12 +46,15 @@
 from __future__ import annotations
 
 from datetime import UTC, datetime
+import inspect
 from pathlib import Path
 from typing import Any
 
 from napt import __version__
 from napt.config.loader import load_effective_config
 from napt.discovery.base import (
+    DiscoveryStrategy,
+    RemoteVersion,
     StrategyResult,
     get_strategy,
     resolve_with_cache,
@@ -143,7 +146,7 @@ def discover_recipe(
         result = run_url_download(config, output_dir, cache=cache)
     else:
         strategy = get_strategy(strategy_name)
-        info = strategy.discover(config)
+        info = _discover_remote(strategy, config, cache)
         logger.info("DISCOVERY", f"Version discovered: {info.version}")
         logger.step(3, 4, "Resolving installer...")
         result = resolve_with_cache(info, config, output_dir, cache)
@@ -168,6 +171,32 @@ def discover_recipe(
     )
 
 
+def _discover_remote(
+    strategy: DiscoveryStrategy,
+    config: dict[str, Any],
+    cache: dict[str, Any] | None,
+) -> RemoteVersion:
+    """Calls a strategy's discover(), passing the cache only if it takes one.
+
+    The ``cache`` argument was added to the
+    [DiscoveryStrategy][napt.discovery.base.DiscoveryStrategy] protocol
+    later; strategies written against the one-argument
+    ``discover(self, app_config)`` keep working.
+    """
+    try:
+        params = inspect.signature(strategy.discover).parameters.values()
+    except (TypeError, ValueError):
+        return strategy.discover(config, cache)
+    positional = [
+        p
+        for p in params
+        if p.kind in (p.POSITIONAL_ONLY, p.POSITIONAL_OR_KEYWORD, p.VAR_POSITIONAL)
+    ]
+    if len(positional) >= 2 or any(p.kind == p.VAR_POSITIONAL for p in positional):
+        return strategy.discover(config, cache)
+    return strategy.discover(config)
+
+
 def _load_cache(
     cache_file: Path | None, stateless: bool, logger: Any
 ) -> dict[str, Any] | None:
@@ -232,6 +261,8 @@ def _save_app_cache(
         "known_version": result.version,
         "strategy": strategy_name,
     }
+    if result.response_cache:
+        cache_entry["response_cache"] = result.response_cache
 
     cache_data.setdefault("apps", {})[app_id] = cache_entry
     cache_data["metadata"] = {
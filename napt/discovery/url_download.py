@@ -29,8 +29,8 @@
     Uses HTTP conditional requests. If a previous run stored an ``ETag``
     or ``Last-Modified`` header in state, those are sent as
     ``If-None-Match`` / ``If-Modified-Since`` on the next request. A
-    server response of HTTP 304 reuses the cached file without a
-    re-download. This is a different mechanism than the version-first
+    server response of HTTP 304, or a 200 that echoes the cached
+    validator, reuses the cached file without a re-download. This is a different mechanism than the version-first
     strategies, which compare version strings (no HTTP round-trip
     required to detect "no change" beyond the initial discovery query).
 
@@ -55,6 +55,7 @@
 
 from napt.download import download_file
 from napt.exceptions import ConfigError, NetworkError, NotModifiedError
+from napt.logging import get_global_logger
 from napt.versioning.msi import extract_msi_metadata
 
 from .base import StrategyResult
@@ -68,9 +69,10 @@ def run_url_download(
     """Downloads a fixed URL and extracts the version from the resulting file.
 
     Issues a conditional HTTP request when ``cache`` carries an ``ETag``
-    or ``Last-Modified``. On HTTP 304 the cached file is reused; otherwise
-    the fresh download is used. Either way, the version is extracted from
-    the file (MSI ProductVersion today).
+    or ``Last-Modified``. When the server reports the file unchanged (HTTP
+    304, or a 200 echoing the cached validator) the cached file and its
+    recorded version are reused; otherwise the fresh download is used and
+    the version is extracted from it (MSI ProductVersion today).
 
     Args:
         app_config: Merged recipe configuration dict containing
@@ -78,13 +80,13 @@ def run_url_download(
         output_dir: Base directory to download into. The file lands
             in ``output_dir / app_id``.
         cache: Cached state for this recipe (``etag``, ``last_modified``,
-            ``file_path``, ``sha256``), or ``None`` when no prior state
-            exists or stateless mode is on.
+            ``file_path``, ``sha256``, ``known_version``), or ``None``
+            when no prior state exists or stateless mode is on.
 
     Returns:
         Resolved version, file path, and download metadata. The
-        ``cached`` field is True when HTTP 304 was used to reuse the
-        previously downloaded file.
+        ``cached`` field is True when the previously downloaded file was
+        reused.
 
     Raises:
         ConfigError: If ``discovery.url`` is missing, or if the
@@ -93,8 +95,6 @@ def run_url_download(
         NetworkError: On download or version-extraction failures.
 
     """
-    from napt.logging import get_global_logger
-
     logger = get_global_logger()
     source = app_config.get("discovery", {})
     url = source.get("url")
@@ -172,11 +172,12 @@ def _resolve_not_modified(
     app_id: str,
     logger: Any,
 ) -> StrategyResult:
-    """Handles HTTP 304 by reusing the cached file or forcing re-download.
+    """Handles an unmodified file by reusing it or forcing re-download.
 
     When the server reports the file is unchanged, this attempts to reuse
-    the cached file path. If the cache is incomplete or the file is gone
-    from disk, it falls back to an unconditional re-download.
+    the cached file path and the version recorded for it, reading the MSI
+    only when no version was cached. If the cache is incomplete or the
+    file is gone from disk, it falls back to an unconditional re-download.
 
     Args:
         url: Original download URL (used for re-download fallback).
@@ -195,14 +196,18 @@ def _resolve_not_modified(
         ConfigError: If the cached file is not an MSI.
 
     """
-    logger.info("CACHE", "File not modified (HTTP 304), using cached version")
+    logger.info("CACHE", "File not modified, using cached version")
 
     cached_path_str = cache.get("file_path") if cache else None
     cached_sha = cache.get("sha256") if cache else None
     cached_path = Path(cached_path_str) if cached_path_str else None
 
     if cache and cached_sha and cached_path is not None and cached_path.exists():
-        version = _extract_version(cached_path)
+        # The cached file is unchanged, so the version recorded for it on the
+        # previous url_download run still holds; skip re-parsing the MSI.
+        version = cache.get("known_version")
+        if not version or cache.get("strategy") != "url_download":
+            version = _extract_version(cached_path)
         preserved_headers: dict[str, str] = {}
         if cache.get("etag"):
             preserved_headers["ETag"] = cache["etag"]
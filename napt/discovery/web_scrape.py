@@ -75,12 +75,12 @@
 from typing import Any
 from urllib.parse import urljoin
 
-from bs4 import BeautifulSoup
 import requests
 
 from napt.discovery.base import RemoteVersion
-from napt.download import make_session
+from napt.download import get_shared_session
 from napt.exceptions import ConfigError, NetworkError
+from napt.logging import get_global_logger
 
 from .base import register_strategy
 
@@ -91,7 +91,9 @@
 class WebScrapeStrategy:
     """Discovery strategy for scraping vendor download pages."""
 
-    def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
+    def discover(
+        self, app_config: dict[str, Any], cache: dict[str, Any] | None = None
+    ) -> RemoteVersion:
         r"""Discovers version and download URL by scraping a vendor page.
 
         Fetches ``discovery.page_url``, locates a download link with
@@ -104,6 +106,8 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
                 ``discovery.page_url``, exactly one of
                 ``discovery.link_selector`` or ``discovery.link_pattern``,
                 and ``discovery.version_pattern``.
+            cache: Cached state for this recipe. Unused; vendor pages are
+                always fetched in full.
 
         Returns:
             Discovered version, the matched link's URL, and
@@ -115,8 +119,6 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
             NetworkError: On page fetch failure.
 
         """
-        from napt.logging import get_global_logger
-
         logger = get_global_logger()
         # Validate configuration
         source = app_config.get("discovery", {})
@@ -154,8 +156,7 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
         # Download the HTML page
         logger.verbose("DISCOVERY", f"Fetching page: {page_url}")
         try:
-            with make_session() as session:
-                response = session.get(page_url, timeout=30)
+            response = get_shared_session().get(page_url, timeout=30)
         except requests.exceptions.RequestException as err:
             raise NetworkError(f"Failed to fetch page: {err}") from err
 
@@ -171,7 +172,10 @@ def discover(self, app_config: dict[str, Any]) -> RemoteVersion:
         download_url = None
 
         if link_selector:
-            # Use CSS selector with BeautifulSoup4
+            # Use CSS selector with BeautifulSoup4 (imported here so
+            # loading the strategy registry doesn't pay for bs4)
+            from bs4 import BeautifulSoup
+
             soup = BeautifulSoup(html_content, "html.parser")
             element = soup.select_one(link_selector)
 
@@ -308,6 +312,8 @@ def validate_config(self, app_config: dict[str, Any]) -> list[str]:
                 errors.append("discovery.link_selector cannot be empty")
             else:
                 # Try to validate CSS selector syntax
+                from bs4 import BeautifulSoup
+
                 try:
                     # Test if selector is parseable
                     soup = BeautifulSoup("<html></html>", "html.parser")
@@ -34,6 +34,17 @@
 
 from napt.exceptions import NotModifiedError
 
-from .download import download_file, make_session
-
-__all__ = ["download_file", "make_session", "NotModifiedError"]
+from .download import (
+    close_shared_session,
+    download_file,
+    get_shared_session,
+    make_session,
+)
+
+__all__ = [
+    "close_shared_session",
+    "download_file",
+    "get_shared_session",
+    "make_session",
+    "NotModifiedError",
+]
@@ -22,6 +22,8 @@
     - Retries on status codes 429, 500, 502, 503, 504 with exponential backoff
     - Sends If-None-Match when etag is provided; If-Modified-Since when
       last_modified is provided
+    - Treats a 200 that echoes the same validator as not modified, for
+      servers that ignore conditional headers
     - Writes to a .part file and renames on success
     - Hashes content during download; validates against expected_sha256 if set
     - Reads filename from Content-Disposition (including RFC 5987 filenames),
@@ -83,6 +85,7 @@
 
 import hashlib
 from pathlib import Path
+import threading
 import time
 from urllib.parse import unquote, urlparse
 
@@ -92,11 +95,16 @@
 
 from napt import __version__
 from napt.exceptions import ConfigError, NetworkError, NotModifiedError
+from napt.logging import get_global_logger
 from napt.results import DownloadResult
 
 # Stream size per chunk (1 MiB). Tune up/down if needed.
 DEFAULT_CHUNK = 1024 * 1024
 
+# Process-wide pooled session (see get_shared_session)
+_shared_session: requests.Session | None = None
+_shared_session_lock = threading.Lock()
+
 
 def _filename_from_cd(content_disposition: str) -> str | None:
     """Extract a filename from a Content-Disposition header.
@@ -189,6 +197,45 @@ def make_session() -> requests.Session:
     return s
 
 
+def get_shared_session() -> requests.Session:
+    """Returns the process-wide pooled session, creating it on first use.
+
+    The session is built by [make_session][napt.download.download.make_session]
+    and kept open for the rest of the process, so repeated calls to the same
+    host (for example, the GitHub API) reuse keep-alive connections instead
+    of paying a new TCP and TLS handshake each time. Creation is guarded by
+    a lock so concurrent first callers share one session.
+
+    Returns:
+        Shared session with NAPT's retry and header defaults.
+
+    Note:
+        Per-request headers such as Authorization must be passed to the
+        individual request, never set on the shared session.
+
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is None:
+            _shared_session = make_session()
+        return _shared_session
+
+
+def close_shared_session() -> None:
+    """Closes the process-wide pooled session if one was created.
+
+    Releases pooled connections. The next
+    [get_shared_session][napt.download.download.get_shared_session] call
+    creates a fresh session.
+
+    """
+    global _shared_session
+    with _shared_session_lock:
+        if _shared_session is not None:
+            _shared_session.close()
+            _shared_session = None
+
+
 def download_file(
     url: str,
     destination_folder: Path,
@@ -224,16 +271,15 @@ def download_file(
             headers.
 
     Raises:
-        NotModifiedError: On HTTP 304, when the server confirms the content
-            has not changed since the last request.
+        NotModifiedError: On HTTP 304, or when the server ignores the
+            conditional headers but returns the same ETag/Last-Modified,
+            confirming the content has not changed since the last request.
         NetworkError: For non-2xx responses (after retries), checksum mismatch,
             or incomplete download (Content-Length mismatch).
         ConfigError: If validate_content_type is True and the server responds
             with text/html.
 
     """
-    from napt.logging import get_global_logger
-
     logger = get_global_logger()
     destination_folder = Path(destination_folder)
     destination_folder.mkdir(parents=True, exist_ok=True)
@@ -281,6 +327,19 @@ def download_file(
 
         logger.verbose("HTTP", f"Response: {resp.status_code} {resp.reason}")
 
+        # Some servers ignore conditional headers but still echo the same
+        # validator; treat that as a 304 and skip streaming the body.
+        if etag:
+            unchanged = resp.headers.get("ETag") == etag
+        else:
+            unchanged = bool(last_modified) and (
+                resp.headers.get("Last-Modified") == last_modified
+            )
+        if unchanged:
+            resp.close()
+            logger.verbose("HTTP", "Validator unchanged, skipping body download")
+            raise NotModifiedError("Remote content not modified (validator unchanged).")
+
         # Content-Disposition beats URL when naming the file.
         cd_name = _filename_from_cd(resp.headers.get("Content-Disposition", ""))
         filename = cd_name or _filename_from_url(resp.url)
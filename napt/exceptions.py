@@ -211,12 +211,15 @@ class AuthError(NAPTError):
 
 
 class NotModifiedError(Exception):
-    """Raised when a conditional HTTP request returns 304 Not Modified.
+    """Raised when a conditional HTTP request finds the content unchanged.
 
     This exception is raised when download_file() receives HTTP 304, meaning
     the server has confirmed that the remote content has not changed since the
-    last request. The function is expected to return a file on disk, and with
-    a 304 response there is no file to return, so it raises instead.
+    last request. It is also raised on a 200 response that echoes the ETag
+    (or, without an ETag, the Last-Modified) the caller supplied: the server
+    ignored the conditional headers, so the body is not downloaded. The
+    function is expected to return a file on disk, and in either case there
+    is no file to return, so it raises instead.
 
     Inherits from Exception (not NAPTError) so that broad catches of all NAPT
     errors do not suppress 304 responses. Callers that supply an ETag must
@@ -175,6 +175,10 @@ def debug(self, prefix: str, message: str) -> None:
         if self._debug:
             print(f"[{prefix}] {message}")
 
+    def is_debug(self) -> bool:
+        """Return whether debug messages are printed."""
+        return self._debug
+
 
 # Global logger instance (defaults to non-verbose)
 _global_logger: Logger = DefaultLogger()
@@ -241,3 +245,21 @@ def set_global_logger(logger: Logger) -> None:
     """
     global _global_logger
     _global_logger = logger
+
+
+def debug_enabled(logger: Logger) -> bool:
+    """Report whether a logger prints debug messages.
+
+    Lets callers skip building expensive debug output (large dumps) that
+    would be discarded. Loggers that do not expose ``is_debug()`` are
+    assumed to want debug output, so custom loggers written against the
+    [Logger][napt.logging.Logger] protocol keep receiving it.
+
+    Args:
+        logger: Logger instance to check.
+
+    Returns:
+        True if debug messages are printed, or the logger does not say.
+    """
+    is_debug = getattr(logger, "is_debug", None)
+    return is_debug() if is_debug is not None else True
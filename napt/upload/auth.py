@@ -50,17 +50,13 @@
 
 import os
 import sys
-
-from azure.core.exceptions import ClientAuthenticationError
-from azure.identity import (
-    ChainedTokenCredential,
-    DeviceCodeCredential,
-    EnvironmentCredential,
-    ManagedIdentityCredential,
-)
+from typing import TYPE_CHECKING
 
 from napt.exceptions import AuthError
 
+if TYPE_CHECKING:
+    from azure.identity import ChainedTokenCredential
+
 __all__ = ["get_access_token", "get_credential", "GRAPH_SCOPES"]
 
 GRAPH_SCOPES = ["https://graph.microsoft.com/.default"]
@@ -112,6 +108,14 @@ def get_credential() -> ChainedTokenCredential:
         A ChainedTokenCredential for non-interactive authentication.
 
     """
+    # azure-identity is slow to import; only commands that talk to Graph
+    # pay for it.
+    from azure.identity import (
+        ChainedTokenCredential,
+        EnvironmentCredential,
+        ManagedIdentityCredential,
+    )
+
     return ChainedTokenCredential(
         EnvironmentCredential(),
         ManagedIdentityCredential(),
@@ -150,6 +154,9 @@ def get_access_token() -> str:
             ```
 
     """
+    from azure.core.exceptions import ClientAuthenticationError
+    from azure.identity import DeviceCodeCredential
+
     # Phase 1: service principal or managed identity
     try:
         return get_credential().get_token(*GRAPH_SCOPES).token
@@ -62,6 +62,12 @@ def test_custom_values(self):
         assert config.app_id == "custom-app"
         assert config.is_msi_installer is True
 
+    def test_has_no_instance_dict(self):
+        """Tests that DetectionConfig instances use slots instead of a dict."""
+        config = DetectionConfig(app_name="Test App", version="1.0.0")
+
+        assert not hasattr(config, "__dict__")
+
     def test_default_is_msi_installer(self):
         """Test default value of is_msi_installer is False."""
         config = DetectionConfig(
@@ -169,6 +175,49 @@ def test_script_has_utf8_encoding(self, tmp_path: Path):
         assert content_bytes[:3] != b"\xef\xbb\xbf", "Script should not have UTF-8 BOM"
         assert output_path.read_text(encoding="utf-8")  # Valid UTF-8
 
+    def test_script_render_reused_for_identical_config(self, tmp_path: Path):
+        """Tests that identical configs reuse the rendered script bytes."""
+        from napt.build.registry_scripts import _render_detection_script
+
+        _render_detection_script.cache_clear()
+        config = DetectionConfig(app_name="Test App", version="1.0.0")
+
+        first = tmp_path / "a" / "Test-App_1.0.0-Detection.ps1"
+        second = tmp_path / "b" / "Test-App_1.0.0-Detection.ps1"
+        generate_detection_script(config, first)
+        generate_detection_script(
+            DetectionConfig(app_name="Test App", version="1.0.0"), second
+        )
+
+        assert first.read_bytes() == second.read_bytes()
+        assert _render_detection_script.cache_info().hits == 1
+
+    def test_script_unchanged_is_not_rewritten(self, tmp_path: Path):
+        """Tests that an identical existing script is left untouched."""
+        import os
+
+        config = DetectionConfig(app_name="Test App", version="1.0.0")
+        output_path = tmp_path / "Test-App_1.0.0-Detection.ps1"
+        generate_detection_script(config, output_path)
+        os.utime(output_path, ns=(0, 0))
+
+        generate_detection_script(config, output_path)
+
+        assert output_path.stat().st_mtime_ns == 0
+
+    def test_script_changed_is_rewritten(self, tmp_path: Path):
+        """Tests that an existing script with stale content is replaced."""
+        output_path = tmp_path / "Test-App-Detection.ps1"
+        generate_detection_script(
+            DetectionConfig(app_name="Test App", version="1.0.0"), output_path
+        )
+
+        generate_detection_script(
+            DetectionConfig(app_name="Test App", version="2.0.0"), output_path
+        )
+
+        assert "2.0.0" in output_path.read_text(encoding="utf-8")
+
     def test_script_creates_parent_directory(self, tmp_path: Path):
         """Test that parent directory is created if it doesn't exist."""
         config = DetectionConfig(
@@ -4,6 +4,8 @@
 
 import argparse
 import os
+import subprocess
+import sys
 import time
 from unittest.mock import MagicMock, patch
 
@@ -39,6 +41,26 @@ def _mock_result(**kwargs) -> MagicMock:
     return result
 
 
+# =============================================================================
+# Startup cost
+# =============================================================================
+
+
+def test_cli_import_defers_heavy_optional_libraries():
+    """Tests that importing the CLI does not load bs4 or azure-identity."""
+    code = (
+        "import sys, napt.cli; "
+        "print(','.join(m for m in ('bs4', 'azure.identity') if m in sys.modules))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    assert result.stdout.strip() == ""
+
+
 # =============================================================================
 # cmd_validate
 # =============================================================================
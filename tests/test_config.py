@@ -11,12 +11,15 @@
 from __future__ import annotations
 
 from typing import Any
+from unittest.mock import patch
 
 import pytest
+import yaml
 
 from napt.config.defaults import DEFAULT_CONFIG, ORG_YAML_TEMPLATE
 from napt.config.loader import load_effective_config
 from napt.exceptions import ConfigError
+from napt.logging import get_logger
 
 
 class TestConfigLoading:
@@ -291,6 +294,67 @@ def test_non_dict_yaml_raises_config_error(self, tmp_test_dir):
             load_effective_config(recipe_path)
 
 
+class TestDebugOutput:
+    """Tests for debug-mode dumps of each configuration layer."""
+
+    def test_layers_not_dumped_without_debug(
+        self, create_yaml_file, sample_recipe_data
+    ):
+        """Test that YAML dumps are skipped when debug output is off."""
+        recipe_path = create_yaml_file("recipe.yaml", sample_recipe_data)
+
+        with patch("yaml.dump") as mock_dump:
+            load_effective_config(recipe_path)
+
+        mock_dump.assert_not_called()
+
+    def test_layers_dumped_with_debug(
+        self, create_yaml_file, sample_recipe_data, capsys
+    ):
+        """Test that the recipe content is printed in debug mode."""
+        recipe_path = create_yaml_file("recipe.yaml", sample_recipe_data)
+
+        with patch("napt.logging._global_logger", get_logger(debug=True)):
+            with patch("yaml.dump", wraps=yaml.dump) as mock_dump:
+                load_effective_config(recipe_path)
+
+        assert mock_dump.called
+        assert "--- Final Merged Configuration ---" in capsys.readouterr().out
+
+    def test_custom_logger_without_is_debug(self, create_yaml_file, sample_recipe_data):
+        """Test that a logger lacking is_debug() still receives the dumps."""
+
+        class MinimalLogger:
+            def __init__(self):
+                self.debug_lines = []
+
+            def step(self, current, total, message):
+                pass
+
+            def info(self, prefix, message):
+                pass
+
+            def warning(self, prefix, message):
+                pass
+
+            def progress(self, prefix, message):
+                pass
+
+            def verbose(self, prefix, message):
+                pass
+
+            def debug(self, prefix, message):
+                self.debug_lines.append(message)
+
+        recipe_path = create_yaml_file("recipe.yaml", sample_recipe_data)
+        logger = MinimalLogger()
+
+        with patch("napt.logging._global_logger", logger):
+            load_effective_config(recipe_path)
+
+        assert logger.debug_lines
+
+
 class TestCodeDefaults:
     """Tests for code-based default configuration."""
 
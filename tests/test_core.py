@@ -101,6 +101,50 @@ def test_discover_recipe_missing_file_raises(self, tmp_test_dir):
         with pytest.raises(ConfigError):
             discover_recipe(nonexistent, tmp_test_dir)
 
+    def test_discover_recipe_supports_one_argument_strategies(
+        self, tmp_test_dir, create_yaml_file
+    ):
+        """Tests that strategies without a cache parameter are still called."""
+        from napt.discovery.base import (
+            RemoteVersion,
+            StrategyResult,
+            register_strategy,
+        )
+
+        class LegacyStrategy:
+            def discover(self, app_config):
+                return RemoteVersion(
+                    version="1.2.3",
+                    download_url="https://example.com/test.msi",
+                    source="legacy_test",
+                )
+
+            def validate_config(self, app_config):
+                return []
+
+        register_strategy("legacy_test", LegacyStrategy)
+        recipe_data = {
+            "apiVersion": "napt/v1",
+            "name": "Test App",
+            "id": "test-app",
+            "discovery": {"strategy": "legacy_test"},
+        }
+        recipe_path = create_yaml_file("recipe.yaml", recipe_data)
+
+        with patch("napt.discovery.manager.resolve_with_cache") as mock_resolve:
+            mock_resolve.return_value = StrategyResult(
+                version="1.2.3",
+                version_source="legacy_test",
+                file_path=tmp_test_dir / "test.msi",
+                sha256="abc123" * 8,
+                headers={},
+                download_url="https://example.com/test.msi",
+                cached=False,
+            )
+            result = discover_recipe(recipe_path, tmp_test_dir, stateless=True)
+
+        assert result.version == "1.2.3"
+
 
 class TestVersionFirstFastPath:
     """Tests for version-first fast path in discover_recipe."""
@@ -306,3 +350,62 @@ def test_version_first_missing_cached_file_redownloads(
         assert result.status == "success"
         fake_file = tmp_test_dir / "test-app" / "app-v1.2.3-installer.msi"
         assert fake_file.exists()
+
+    def test_version_first_persists_response_cache(
+        self, tmp_test_dir, create_yaml_file
+    ):
+        """Tests that a strategy's response_cache is saved in the app's entry."""
+        from pathlib import Path
+
+        from napt.discovery.base import RemoteVersion
+
+        recipe_data = {
+            "apiVersion": "napt/v1",
+            "name": "Test App",
+            "id": "test-app",
+            "discovery": {
+                "strategy": "api_github",
+                "repo": "owner/repo",
+                "asset_pattern": r".*\.msi$",
+            },
+        }
+        recipe_path = create_yaml_file("recipe.yaml", recipe_data)
+
+        cached_file = tmp_test_dir / "test-app" / "installer.msi"
+        cached_file.parent.mkdir(parents=True)
+        cached_file.write_bytes(b"installer")
+        prior_entry = {
+            "url": "https://example.com/installer.msi",
+            "known_version": "1.2.3",
+            "sha256": "abc123" * 8,
+            "file_path": str(cached_file),
+        }
+        state = {
+            "metadata": {"napt_version": "0.1.0", "schema_version": "2"},
+            "apps": {"test-app": prior_entry},
+        }
+        response_cache = {"url": "https://api", "etag": '"abc"', "body": {}}
+
+        with (
+            patch("napt.discovery.manager.load_cache", return_value=state),
+            patch("napt.discovery.manager.save_cache") as mock_save,
+            patch(
+                "napt.discovery.api_github.ApiGithubStrategy.discover",
+                return_value=RemoteVersion(
+                    version="1.2.3",
+                    download_url="https://example.com/installer.msi",
+                    source="api_github",
+                    response_cache=response_cache,
+                ),
+            ) as mock_discover,
+        ):
+            discover_recipe(
+                recipe_path,
+                tmp_test_dir,
+                cache_file=Path("state.json"),
+                state_dir=tmp_test_dir / "state",
+            )
+
+        assert mock_discover.call_args.args[1] == prior_entry
+        saved = mock_save.call_args.args[0]
+        assert saved["apps"]["test-app"]["response_cache"] == response_cache
@@ -2,14 +2,23 @@
 
 from __future__ import annotations
 
+import io
+from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 import requests_mock
+import urllib3
 
 from napt.discovery.api_github import ApiGithubStrategy
-from napt.discovery.api_json import ApiJsonStrategy
-from napt.discovery.base import RemoteVersion, get_strategy, register_strategy
+from napt.discovery.api_json import ApiJsonStrategy, _parse_path
+from napt.discovery.base import (
+    RemoteVersion,
+    StrategyResult,
+    expand_env_reference,
+    get_strategy,
+    register_strategy,
+)
 from napt.discovery.url_download import run_url_download
 from napt.discovery.web_scrape import WebScrapeStrategy
 from napt.exceptions import ConfigError, NetworkError
@@ -29,6 +38,13 @@ def test_get_unknown_strategy_raises(self):
         with pytest.raises(ConfigError, match="Unknown discovery strategy"):
             get_strategy("nonexistent_strategy")
 
+    def test_unknown_strategy_lists_names_sorted(self):
+        """Tests that the unknown-strategy error lists names alphabetically."""
+        with pytest.raises(ConfigError, match="api_github, api_json") as exc_info:
+            get_strategy("nonexistent_strategy")
+        available = str(exc_info.value).split("Available: ")[1].split(", ")
+        assert available == sorted(available)
+
     def test_url_download_not_in_registry(self):
         """Tests that url_download is intentionally not a registered strategy."""
         with pytest.raises(ConfigError, match="Unknown discovery strategy"):
@@ -52,6 +68,66 @@ def validate_config(self, app_config):
         strategy = get_strategy("custom_test")
         assert isinstance(strategy, CustomStrategy)
 
+    def test_strategy_instance_reused(self):
+        """Tests that repeated lookups return the same strategy instance."""
+        assert get_strategy("api_github") is get_strategy("api_github")
+
+    def test_reregistering_replaces_cached_instance(self):
+        """Tests that registering a name again drops its cached instance."""
+
+        class FirstStrategy:
+            def discover(self, app_config, cache=None): ...
+
+            def validate_config(self, app_config):
+                return []
+
+        class SecondStrategy(FirstStrategy):
+            pass
+
+        register_strategy("reregister_test", FirstStrategy)
+        assert isinstance(get_strategy("reregister_test"), FirstStrategy)
+        register_strategy("reregister_test", SecondStrategy)
+        assert isinstance(get_strategy("reregister_test"), SecondStrategy)
+
+
+class TestDiscoveryResults:
+    """Tests for the discovery result dataclasses."""
+
+    def test_results_have_no_instance_dict(self):
+        """Tests that RemoteVersion and StrategyResult are slotted."""
+        info = RemoteVersion(
+            version="1.0.0", download_url="https://example.com/a.msi", source="x"
+        )
+        result = StrategyResult(
+            version="1.0.0",
+            version_source="x",
+            file_path=Path("a.msi"),
+            sha256="0" * 64,
+            headers={},
+            download_url="https://example.com/a.msi",
+            cached=True,
+        )
+        assert not hasattr(info, "__dict__")
+        assert not hasattr(result, "__dict__")
+
+
+class TestExpandEnvReference:
+    """Tests for expand_env_reference."""
+
+    def test_plain_value_returned_unchanged(self):
+        """Tests that a value that is not a reference is returned as-is."""
+        assert expand_env_reference("literal-token") == "literal-token"
+
+    def test_reference_expanded(self, monkeypatch):
+        """Tests that a ${VAR} reference expands to the variable's value."""
+        monkeypatch.setenv("NAPT_TEST_TOKEN", "secret")
+        assert expand_env_reference("${NAPT_TEST_TOKEN}") == "secret"
+
+    def test_unset_reference_returns_none(self, monkeypatch):
+        """Tests that a reference to an unset variable returns None."""
+        monkeypatch.delenv("NAPT_TEST_TOKEN", raising=False)
+        assert expand_env_reference("${NAPT_TEST_TOKEN}") is None
+
 
 class TestUrlDownloadFlow:
     """Tests for the url_download flow (run_url_download)."""
@@ -160,6 +236,35 @@ def test_cache_not_modified_uses_cached_file(self, tmp_test_dir):
         assert result.cached is True
         assert result.headers.get("ETag") == 'W/"abc123"'
 
+    def test_304_reuses_cached_version_without_parsing_msi(self, tmp_test_dir):
+        """Tests that HTTP 304 returns the cached version without reading the MSI."""
+        app_config = {
+            "id": "test-app",
+            "discovery": {"url": "https://example.com/installer.msi"},
+        }
+        app_dir = tmp_test_dir / "test-app"
+        app_dir.mkdir()
+        cached_file = app_dir / "installer.msi"
+        cached_file.write_bytes(b"fake cached msi")
+        cache = {
+            "etag": 'W/"abc123"',
+            "file_path": str(cached_file),
+            "sha256": "cached_sha256",
+            "known_version": "1.0.0",
+            "strategy": "url_download",
+        }
+
+        with requests_mock.Mocker() as m:
+            m.get("https://example.com/installer.msi", status_code=304)
+            with patch(
+                "napt.discovery.url_download.extract_msi_metadata"
+            ) as mock_extract:
+                result = run_url_download(app_config, tmp_test_dir, cache=cache)
+
+        mock_extract.assert_not_called()
+        assert result.version == "1.0.0"
+        assert result.cached is True
+
     def test_cache_modified_redownloads(self, tmp_test_dir):
         """Tests that HTTP 200 downloads the new file."""
         app_config = {
@@ -677,6 +782,24 @@ def test_rate_limited_raises(self):
             with pytest.raises(NetworkError, match="rate limit"):
                 strategy.discover(app_config)
 
+    def test_rate_limited_reports_reset_time(self):
+        """Tests that an exhausted rate limit names its reset time."""
+        strategy = ApiGithubStrategy()
+        app_config = {"discovery": {"repo": "owner/repo", "asset_pattern": ".*"}}
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.github.com/repos/owner/repo/releases/latest",
+                status_code=403,
+                headers={
+                    "X-RateLimit-Remaining": "0",
+                    "X-RateLimit-Reset": "1760000000",
+                },
+            )
+            with pytest.raises(
+                NetworkError, match=r"rate limit.*resets at 08:53:20 UTC"
+            ):
+                strategy.discover(app_config)
+
     def test_prerelease_rejected_when_flag_false(self):
         """Tests that a prerelease latest release is rejected when prerelease=False."""
         strategy = ApiGithubStrategy()
@@ -737,7 +860,9 @@ def test_no_matching_asset_raises(self):
                 "https://api.github.com/repos/owner/repo/releases/latest",
                 json=release_data,
             )
-            with pytest.raises(ConfigError, match="No assets matched"):
+            with pytest.raises(
+                ConfigError, match="No assets matched.*Available assets: installer.exe"
+            ):
                 strategy.discover(app_config)
 
     def test_named_version_capture_group(self):
@@ -770,6 +895,251 @@ def test_named_version_capture_group(self):
         assert version_info.source == "api_github"
 
 
+class TestApiGithubVersionExtraction:
+    """Tests which capture group of version_pattern becomes the version."""
+
+    @pytest.mark.parametrize(
+        ("version_pattern", "expected"),
+        [
+            (r"release-(?P<version>[0-9.]+)", "1.2.3"),
+            (r"release-([0-9.]+)", "1.2.3"),
+            (r"[0-9.]+", "1.2.3"),
+        ],
+    )
+    def test_version_group_selection(self, version_pattern, expected):
+        """Tests named group, then group 1, then the full match."""
+        app_config = {
+            "discovery": {
+                "repo": "owner/repo",
+                "asset_pattern": ".*",
+                "version_pattern": version_pattern,
+            }
+        }
+        release_data = {
+            "tag_name": "release-1.2.3",
+            "assets": [
+                {"name": "a.msi", "browser_download_url": "https://example.com/a.msi"}
+            ],
+        }
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.github.com/repos/owner/repo/releases/latest",
+                json=release_data,
+            )
+            info = ApiGithubStrategy().discover(app_config)
+
+        assert info.version == expected
+
+    @pytest.mark.parametrize(
+        ("tag_name", "expected"),
+        [
+            ("v1.2.3", "1.2.3"),
+            ("2024.10", "2024.10"),
+            ("release-1.2.3", "1.2.3"),
+            ("v1.2.3-beta", "1.2.3"),
+        ],
+    )
+    def test_default_pattern(self, tag_name, expected):
+        """Tests the default pattern on plain and decorated tags."""
+        app_config = {"discovery": {"repo": "owner/repo", "asset_pattern": ".*"}}
+        release_data = {
+            "tag_name": tag_name,
+            "assets": [
+                {"name": "a.msi", "browser_download_url": "https://example.com/a.msi"}
+            ],
+        }
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.github.com/repos/owner/repo/releases/latest",
+                json=release_data,
+            )
+            info = ApiGithubStrategy().discover(app_config)
+
+        assert info.version == expected
+
+
+class TestApiGithubConditionalRequests:
+    """Tests ETag revalidation of the GitHub release response."""
+
+    API_URL = "https://api.github.com/repos/owner/repo/releases/latest"
+    APP_CONFIG = {"discovery": {"repo": "owner/repo", "asset_pattern": r".*\.msi$"}}
+
+    def test_etag_returned_with_trimmed_release(self):
+        """Tests that a 200 response yields the ETag and trimmed release data."""
+        release_data = {
+            "tag_name": "v1.2.3",
+            "prerelease": False,
+            "author": {"login": "someone"},
+            "assets": [
+                {
+                    "name": "installer.msi",
+                    "browser_download_url": "https://example.com/installer.msi",
+                    "download_count": 42,
+                }
+            ],
+        }
+        with requests_mock.Mocker() as m:
+            m.get(self.API_URL, json=release_data, headers={"ETag": '"abc"'})
+            info = ApiGithubStrategy().discover(self.APP_CONFIG)
+
+        assert info.response_cache == {
+            "url": self.API_URL,
+            "etag": '"abc"',
+            "body": {
+                "tag_name": "v1.2.3",
+                "prerelease": False,
+                "assets": [
+                    {
+                        "name": "installer.msi",
+                        "browser_download_url": "https://example.com/installer.msi",
+                    }
+                ],
+            },
+        }
+
+    def test_not_modified_reuses_cached_release(self):
+        """Tests that HTTP 304 reparses the cached release with current patterns."""
+        cache = {
+            "response_cache": {
+                "url": self.API_URL,
+                "etag": '"abc"',
+                "body": {
+                    "tag_name": "v1.2.3",
+                    "prerelease": False,
+                    "assets": [
+                        {
+                            "name": "installer.exe",
+                            "browser_download_url": "https://example.com/a.exe",
+                        },
+                        {
+                            "name": "installer.msi",
+                            "browser_download_url": "https://example.com/a.msi",
+                        },
+                    ],
+                },
+            }
+        }
+        with requests_mock.Mocker() as m:
+            m.get(self.API_URL, status_code=304)
+            info = ApiGithubStrategy().discover(self.APP_CONFIG, cache)
+            sent = m.request_history[0].headers.get("If-None-Match")
+
+        assert sent == '"abc"'
+        assert info.version == "1.2.3"
+        assert info.download_url == "https://example.com/a.msi"
+        assert info.response_cache == cache["response_cache"]
+
+    def test_release_request_accepts_gzip(self):
+        """Tests that the release request asks for a compressed response."""
+        release_data = {
+            "tag_name": "v1.2.3",
+            "assets": [
+                {
+                    "name": "installer.msi",
+                    "browser_download_url": "https://example.com/installer.msi",
+                }
+            ],
+        }
+        with requests_mock.Mocker() as m:
+            m.get(self.API_URL, json=release_data)
+            ApiGithubStrategy().discover(self.APP_CONFIG)
+            sent = m.request_history[0].headers.get("Accept-Encoding")
+
+        assert sent == "gzip, deflate"
+
+    def test_cached_response_for_other_repo_not_sent(self):
+        """Tests that an ETag cached for a different release URL is ignored."""
+        cache = {
+            "response_cache": {
+                "url": "https://api.github.com/repos/other/repo/releases/latest",
+                "etag": '"abc"',
+                "body": {},
+            }
+        }
+        release_data = {
+            "tag_name": "v1.2.3",
+            "assets": [
+                {
+                    "name": "installer.msi",
+                    "browser_download_url": "https://example.com/installer.msi",
+                }
+            ],
+        }
+        with requests_mock.Mocker() as m:
+            m.get(self.API_URL, json=release_data)
+            info = ApiGithubStrategy().discover(self.APP_CONFIG, cache)
+            sent = m.request_history[0].headers.get("If-None-Match")
+
+        assert sent is None
+        assert info.response_cache is None
+
+    @pytest.mark.parametrize(
+        "record",
+        [
+            {"url": API_URL, "etag": '"abc"'},
+            {"url": API_URL, "etag": '"abc"', "body": None},
+            {"url": API_URL, "etag": '"abc"', "body": {"tag_name": "v1.0.0"}},
+            "not a record",
+            ["not", "a", "record"],
+        ],
+    )
+    def test_malformed_cached_record_forces_full_fetch(self, record):
+        """Tests that a cached record missing release data is not revalidated."""
+        release_data = {
+            "tag_name": "v1.2.3",
+            "assets": [
+                {
+                    "name": "installer.msi",
+                    "browser_download_url": "https://example.com/installer.msi",
+                }
+            ],
+        }
+        with requests_mock.Mocker() as m:
+            m.get(self.API_URL, json=release_data)
+            info = ApiGithubStrategy().discover(
+                self.APP_CONFIG, {"response_cache": record}
+            )
+            sent = m.request_history[0].headers.get("If-None-Match")
+
+        assert sent is None
+        assert info.version == "1.2.3"
+
+    def test_last_modified_cached_and_revalidated(self):
+        """Tests that Last-Modified is cached and replayed as If-Modified-Since."""
+        last_modified = "Wed, 01 Oct 2025 12:00:00 GMT"
+        release_data = {
+            "tag_name": "v1.2.3",
+            "assets": [
+                {
+                    "name": "installer.msi",
+                    "browser_download_url": "https://example.com/installer.msi",
+                }
+            ],
+        }
+        with requests_mock.Mocker() as m:
+            m.get(
+                self.API_URL,
+                json=release_data,
+                headers={"Last-Modified": last_modified},
+            )
+            first = ApiGithubStrategy().discover(self.APP_CONFIG)
+
+        assert first.response_cache["last_modified"] == last_modified
+        assert "etag" not in first.response_cache
+
+        with requests_mock.Mocker() as m:
+            m.get(self.API_URL, status_code=304)
+            second = ApiGithubStrategy().discover(
+                self.APP_CONFIG, {"response_cache": first.response_cache}
+            )
+            sent = m.request_history[0].headers
+
+        assert sent.get("If-Modified-Since") == last_modified
+        assert "If-None-Match" not in sent
+        assert second.version == "1.2.3"
+        assert second.response_cache == first.response_cache
+
+
 class TestApiGithubValidateConfig:
     """Tests for ApiGithubStrategy.validate_config()."""
 
@@ -897,6 +1267,45 @@ def test_invalid_json_response_raises(self):
             with pytest.raises(NetworkError, match="Invalid JSON"):
                 strategy.discover(app_config)
 
+    def test_oversized_response_raises(self):
+        """Tests that a body over the size cap raises NetworkError."""
+        strategy = ApiJsonStrategy()
+        app_config = {
+            "discovery": {
+                "api_url": "https://api.example.com/latest",
+                "version_path": "version",
+                "download_url_path": "url",
+            }
+        }
+        with patch("napt.discovery.api_json._MAX_RESPONSE_BYTES", 16):
+            with requests_mock.Mocker() as m:
+                m.get(
+                    "https://api.example.com/latest",
+                    json={"version": "1.0.0", "url": "https://example.com/a.msi"},
+                )
+                with pytest.raises(NetworkError, match="exceeds 16 bytes"):
+                    strategy.discover(app_config)
+
+    def test_truncated_response_raises_network_error(self):
+        """Tests that a connection dropped mid-body raises NetworkError."""
+
+        class TruncatedBody(io.BytesIO):
+            def read(self, *args, **kwargs):
+                raise urllib3.exceptions.ProtocolError("Connection broken")
+
+        strategy = ApiJsonStrategy()
+        app_config = {
+            "discovery": {
+                "api_url": "https://api.example.com/latest",
+                "version_path": "version",
+                "download_url_path": "url",
+            }
+        }
+        with requests_mock.Mocker() as m:
+            m.get("https://api.example.com/latest", body=TruncatedBody())
+            with pytest.raises(NetworkError, match="Failed to read API response"):
+                strategy.discover(app_config)
+
     def test_version_path_not_found_raises(self):
         """Tests that a version_path that matches nothing raises ConfigError."""
         strategy = ApiJsonStrategy()
@@ -988,6 +1397,96 @@ def test_nested_json_path(self):
         assert "3.1.4" in version_info.download_url
 
 
+class TestApiJsonConditionalRequests:
+    """Tests ETag / Last-Modified revalidation of api_json GET responses."""
+
+    API_URL = "https://api.example.com/latest"
+    APP_CONFIG = {
+        "discovery": {
+            "api_url": API_URL,
+            "version_path": "version",
+            "download_url_path": "url",
+        }
+    }
+    RESPONSE = {"version": "2.0.0", "url": "https://example.com/app.msi"}
+
+    def test_validators_cached_with_extracted_values(self):
+        """Tests that a 200 with an ETag yields a cacheable record."""
+        with requests_mock.Mocker() as m:
+            m.get(self.API_URL, json=self.RESPONSE, headers={"ETag": '"v2"'})
+            info = ApiJsonStrategy().discover(self.APP_CONFIG)
+
+        assert info.response_cache == {
+            "url": self.API_URL,
+            "paths": ["version", "url"],
+            "etag": '"v2"',
+            "body": {"version": "2.0.0", "download_url": "https://example.com/app.msi"},
+        }
+
+    def test_not_modified_reuses_cached_values(self):
+        """Tests that HTTP 304 returns the cached version and URL."""
+        with requests_mock.Mocker() as m:
+            m.get(self.API_URL, json=self.RESPONSE, headers={"ETag": '"v2"'})
+            first = ApiJsonStrategy().discover(self.APP_CONFIG)
+
+        with requests_mock.Mocker() as m:
+            m.get(self.API_URL, status_code=304)
+            second = ApiJsonStrategy().discover(
+                self.APP_CONFIG, {"response_cache": first.response_cache}
+            )
+            sent = m.request_history[0].headers.get("If-None-Match")
+
+        assert sent == '"v2"'
+        assert second.version == "2.0.0"
+        assert second.download_url == "https://example.com/app.msi"
+        assert second.response_cache == first.response_cache
+
+    def test_changed_paths_discard_cached_values(self):
+        """Tests that a record saved for other JSONPaths is not revalidated."""
+        cache = {
+            "response_cache": {
+                "url": self.API_URL,
+                "paths": ["stable.version", "url"],
+                "etag": '"v2"',
+                "body": {"version": "1.0.0", "download_url": "https://x/old.msi"},
+            }
+        }
+        with requests_mock.Mocker() as m:
+            m.get(self.API_URL, json=self.RESPONSE)
+            info = ApiJsonStrategy().discover(self.APP_CONFIG, cache)
+            sent = m.request_history[0].headers.get("If-None-Match")
+
+        assert sent is None
+        assert info.version == "2.0.0"
+
+    def test_malformed_cached_record_forces_full_fetch(self):
+        """Tests that a cached record missing its values is not revalidated."""
+        cache = {
+            "response_cache": {
+                "url": self.API_URL,
+                "paths": ["version", "url"],
+                "etag": '"v2"',
+                "body": {"version": "2.0.0"},
+            }
+        }
+        with requests_mock.Mocker() as m:
+            m.get(self.API_URL, json=self.RESPONSE)
+            info = ApiJsonStrategy().discover(self.APP_CONFIG, cache)
+            sent = m.request_history[0].headers.get("If-None-Match")
+
+        assert sent is None
+        assert info.download_url == "https://example.com/app.msi"
+
+    def test_post_responses_not_cached(self):
+        """Tests that POST endpoints never produce a revalidation record."""
+        app_config = {"discovery": {**self.APP_CONFIG["discovery"], "method": "POST"}}
+        with requests_mock.Mocker() as m:
+            m.post(self.API_URL, json=self.RESPONSE, headers={"ETag": '"v2"'})
+            info = ApiJsonStrategy().discover(app_config)
+
+        assert info.response_cache is None
+
+
 class TestApiJsonValidateConfig:
     """Tests for ApiJsonStrategy.validate_config()."""
 
@@ -1005,6 +1504,29 @@ def test_valid_config_returns_empty(self):
         )
         assert errors == []
 
+    def test_jsonpath_parsed_once_for_validation_and_discovery(self):
+        """Tests that discovery reuses the paths parsed during validation."""
+        _parse_path.cache_clear()
+        app_config = {
+            "discovery": {
+                "api_url": "https://api.example.com/latest",
+                "version_path": "release.version",
+                "download_url_path": "release.url",
+            }
+        }
+        strategy = ApiJsonStrategy()
+        assert strategy.validate_config(app_config) == []
+        with requests_mock.Mocker() as m:
+            m.get(
+                "https://api.example.com/latest",
+                json={"release": {"version": "1.0", "url": "https://x/a.msi"}},
+            )
+            strategy.discover(app_config)
+
+        info = _parse_path.cache_info()
+        assert info.misses == 2
+        assert info.hits == 2
+
     def test_missing_api_url(self):
         """Tests that missing api_url is reported."""
         strategy = ApiJsonStrategy()
@@ -238,6 +238,53 @@ def test_conditional_request_modified_downloads(tmp_test_dir: Path) -> None:
     assert result.headers.get("ETag") == '"new_etag"'
 
 
+def test_unchanged_validator_on_200_skips_download(tmp_test_dir: Path) -> None:
+    """Tests that a 200 echoing the cached Last-Modified raises NotModifiedError."""
+    url = "https://example.com/file.bin"
+    last_modified = "Mon, 01 Jan 2024 00:00:00 GMT"
+
+    with requests_mock.Mocker() as m:
+        # Server ignores If-Modified-Since and resends the full body
+        m.get(url, content=b"same", headers={"Last-Modified": last_modified})
+
+        with pytest.raises(NotModifiedError, match="validator unchanged"):
+            download_file(url, tmp_test_dir, last_modified=last_modified)
+
+    assert not list(tmp_test_dir.iterdir())
+
+
+def test_unchanged_etag_on_200_skips_download(tmp_test_dir: Path) -> None:
+    """Tests that a 200 echoing the cached ETag raises NotModifiedError."""
+    url = "https://example.com/file.bin"
+    etag = '"abc123"'
+
+    with requests_mock.Mocker() as m:
+        # Server ignores If-None-Match and resends the full body
+        m.get(url, content=b"same", headers={"ETag": etag})
+
+        with pytest.raises(NotModifiedError, match="validator unchanged"):
+            download_file(url, tmp_test_dir, etag=etag)
+
+    assert not list(tmp_test_dir.iterdir())
+
+
+def test_changed_etag_on_200_downloads(tmp_test_dir: Path) -> None:
+    """Tests that a 200 with a different ETag downloads the new body."""
+    url = "https://example.com/file.bin"
+    data = b"new content"
+
+    with requests_mock.Mocker() as m:
+        m.get(
+            url,
+            content=data,
+            headers={"Content-Length": str(len(data)), "ETag": '"def456"'},
+        )
+        result = download_file(url, tmp_test_dir, etag='"abc123"')
+
+    assert result.file_path.read_bytes() == data
+    assert result.headers.get("ETag") == '"def456"'
+
+
 def test_creates_destination_folder(tmp_test_dir: Path) -> None:
     """Tests that destination folder is created if it doesn't exist."""
     url = "https://example.com/file.bin"
@@ -267,3 +314,17 @@ def test_incomplete_download_raises_network_error(tmp_test_dir: Path) -> None:
 
     # .part file should be cleaned up
     assert not list(tmp_test_dir.glob("*.part"))
+
+
+def test_shared_session_is_reused_until_closed() -> None:
+    """Tests that the shared session persists across calls until closed."""
+    from napt.download import close_shared_session, get_shared_session
+
+    close_shared_session()
+    first = get_shared_session()
+
+    assert get_shared_session() is first
+
+    close_shared_session()
+    assert get_shared_session() is not first
+    close_shared_session()